@@ -0,0 +1,247 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from .rsa import find_n
+
+
+def read_moduli(path: str) -> Iterator[int]:
+    """
+    Stream RSA moduli from a text file, one per line.
+
+    Lines may hold a decimal integer or a hexadecimal integer prefixed with
+    '0x'. Blank lines and lines starting with '#' are skipped. The file is read
+    line by line, so it is never loaded into memory as a whole.
+
+    Args:
+        path (str): Path to the moduli file.
+
+    Yields:
+        int: Each modulus in file order.
+
+    Raises:
+        ValueError: If a line is not a valid integer greater than 1.
+    """
+    with open(path, "r", encoding="ascii") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            n = int(line, 0)
+            if n <= 1:
+                raise ValueError(f"Line {line_no}: modulus must be greater than 1, got {n}.")
+            yield n
+
+
+def _mul_pairs(level: Sequence[int]) -> List[int]:
+    """
+    Multiply neighbouring entries of one product tree level.
+
+    Args:
+        level (Sequence[int]): Values of the level below.
+
+    Returns:
+        List[int]: Values of the level above (an odd last entry is carried up).
+    """
+    return [level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)]
+
+
+def _reduce_pairs(args: Tuple[Sequence[int], Sequence[int]]) -> List[int]:
+    """
+    Reduce each parent remainder modulo the squares of its two children.
+
+    Args:
+        args (Tuple[Sequence[int], Sequence[int]]): (parent remainders, child level).
+
+    Returns:
+        List[int]: Remainders for the child level.
+    """
+    parents, children = args
+    return [parents[i // 2] % (child * child) for i, child in enumerate(children)]
+
+
+def _final_gcds(args: Tuple[Sequence[int], Sequence[int]]) -> List[int]:
+    """
+    Finish batch-GCD for a block of moduli.
+
+    Args:
+        args (Tuple[Sequence[int], Sequence[int]]): (leaf remainders, moduli).
+
+    Returns:
+        List[int]: gcd(n_i, (P mod n_i²) / n_i) for each modulus.
+    """
+    rems, moduli = args
+    return [math.gcd(n, r // n) for r, n in zip(rems, moduli)]
+
+
+def _chunks(level: Sequence[int], parts: int, align: int = 1) -> List[Tuple[int, int]]:
+    """
+    Split range(len(level)) into roughly equal (start, stop) blocks.
+
+    Args:
+        level (Sequence[int]): Sequence being split.
+        parts (int): Desired number of blocks.
+        align (int): Block boundaries are multiples of this value.
+
+    Returns:
+        List[Tuple[int, int]]: Block boundaries.
+    """
+    size = max(align, -(-len(level) // parts))
+    size += -size % align
+    return [(i, min(i + size, len(level))) for i in range(0, len(level), size)]
+
+
+def product_tree(moduli: Sequence[int], pool: Optional[ProcessPoolExecutor] = None,
+                 workers: int = 1) -> List[List[int]]:
+    """
+    Build the product tree of a list of moduli.
+
+    Level 0 is the moduli themselves, and the last level holds the single
+    product of every modulus.
+
+    Args:
+        moduli (Sequence[int]): RSA moduli.
+        pool (ProcessPoolExecutor | None): Pool used to multiply wide levels in parallel.
+        workers (int): Number of blocks each level is split into when a pool is given.
+
+    Returns:
+        List[List[int]]: Tree levels from leaves to root.
+
+    Raises:
+        ValueError: If no moduli are given.
+    """
+    if not moduli:
+        raise ValueError("At least one modulus is required.")
+
+    tree = [list(moduli)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        if pool is not None and len(level) >= 4 * workers:
+            blocks = [level[a:b] for a, b in _chunks(level, workers, align=2)]
+            tree.append([x for part in pool.map(_mul_pairs, blocks) for x in part])
+        else:
+            tree.append(_mul_pairs(level))
+    return tree
+
+
+def remainder_tree(tree: List[List[int]], pool: Optional[ProcessPoolExecutor] = None,
+                   workers: int = 1) -> List[int]:
+    """
+    Push the root product down a product tree, reducing modulo each node squared.
+
+    Args:
+        tree (List[List[int]]): Output of product_tree().
+        pool (ProcessPoolExecutor | None): Pool used to reduce wide levels in parallel.
+        workers (int): Number of blocks each level is split into when a pool is given.
+
+    Returns:
+        List[int]: P mod n_i² for every leaf n_i, where P is the product of all moduli.
+    """
+    rems = tree[-1]
+    for level in reversed(tree[:-1]):
+        if pool is not None and len(level) >= 4 * workers:
+            jobs = [(rems[a // 2:(b + 1) // 2], level[a:b])
+                    for a, b in _chunks(level, workers, align=2)]
+            rems = [x for part in pool.map(_reduce_pairs, jobs) for x in part]
+        else:
+            rems = _reduce_pairs((rems, level))
+    return rems
+
+
+def batch_gcd(moduli: Iterable[int], processes: Optional[int] = None) -> List[int]:
+    """
+    Compute gcd(n_i, product of all other moduli) for every modulus at once.
+
+    Uses Bernstein's product tree / remainder tree method, which runs in
+    quasi-linear time instead of the quadratic cost of calling math.gcd on
+    every pair. A result greater than 1 means that modulus shares a prime with
+    at least one other modulus.
+
+    Args:
+        moduli (Iterable[int]): RSA moduli, e.g. from read_moduli().
+        processes (int | None): Worker processes to use. None uses every core,
+            1 runs everything in the current process.
+
+    Returns:
+        List[int]: One gcd per modulus, in input order.
+
+    Raises:
+        ValueError: If no moduli are given.
+
+    Example:
+        >>> batch_gcd([find_n(7, 11), find_n(13, 31), find_n(7, 19)], processes=1)
+        [7, 1, 7]
+    """
+    moduli = list(moduli)
+    workers = processes or os.cpu_count() or 1
+
+    if workers == 1:
+        tree = product_tree(moduli)
+        return _final_gcds((remainder_tree(tree), moduli))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tree = product_tree(moduli, pool, workers)
+        rems = remainder_tree(tree, pool, workers)
+        blocks = _chunks(moduli, workers)
+        jobs = [(rems[a:b], moduli[a:b]) for a, b in blocks]
+        return [g for part in pool.map(_final_gcds, jobs) for g in part]
+
+
+def find_shared_factors(
+    moduli: Iterable[int], processes: Optional[int] = None
+) -> List[Tuple[int, int, int]]:
+    """
+    Find every pair of moduli that shares a prime factor.
+
+    batch_gcd() narrows the input down to the vulnerable moduli, and only that
+    (normally tiny) subset is compared pairwise.
+
+    Args:
+        moduli (Iterable[int]): RSA moduli, e.g. from read_moduli().
+        processes (int | None): Worker processes passed to batch_gcd().
+
+    Returns:
+        List[Tuple[int, int, int]]: (i, j, shared factor) for each pair with i < j,
+        where i and j are positions in the input.
+
+    Example:
+        >>> find_shared_factors([find_n(7, 11), find_n(13, 31), find_n(7, 19)], processes=1)
+        [(0, 2, 7)]
+    """
+    moduli = list(moduli)
+    gcds = batch_gcd(moduli, processes)
+    weak = [i for i, g in enumerate(gcds) if g != 1]
+
+    pairs = []
+    for a, i in enumerate(weak):
+        for j in weak[a + 1:]:
+            g = math.gcd(moduli[i], moduli[j])
+            if g != 1:
+                pairs.append((i, j, g))
+    return pairs
+
+
+def main() -> None:
+    """
+    Demonstrates a shared-factor scan over a handful of small moduli.
+    """
+    moduli = [
+        find_n(7, 11),
+        find_n(13, 31),
+        find_n(5, 11),
+        find_n(17, 19),
+        find_n(13, 23),
+    ]
+    print(f"Moduli: {moduli}")
+    print(f"Batch GCDs: {batch_gcd(moduli, processes=1)}")
+    for i, j, p in find_shared_factors(moduli, processes=1):
+        print(f"n[{i}] = {moduli[i]} and n[{j}] = {moduli[j]} share the factor {p}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import bisect
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from .rsa import find_n, find_totient, find_e_any, find_d
+
+TRIAL_DIVISION_LIMIT = 1 << 32  # n below this is factored by trial division alone
+TRIAL_DIVISOR_LIMIT = 1 << 24   # largest divisor time_methods() tries (a 16 MB sieve)
+FERMAT_STEPS = 1 << 16          # steps Fermat's method takes before giving up
+RHO_ITERATIONS = 1 << 20        # cycle length Pollard's rho reaches before giving up
+
+_sieve = bytearray(b"\x00\x00\x01\x01")  # _sieve[i] == 1 iff i is prime
+_primes: List[int] = [2, 3]
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)  # exact for n below 3.3e24
+
+
+def prime_sieve(limit: int) -> List[int]:
+    """
+    Return every prime up to and including limit.
+
+    The sieve is cached between calls and only grows, so repeated calls with
+    similar limits do no extra work.
+
+    Args:
+        limit (int): Largest number to include.
+
+    Returns:
+        List[int]: Primes in ascending order.
+
+    Example:
+        >>> prime_sieve(20)
+        [2, 3, 5, 7, 11, 13, 17, 19]
+    """
+    global _sieve, _primes
+    if limit >= len(_sieve):
+        size = max(limit + 1, 2 * len(_sieve))
+        sieve = bytearray([1]) * size
+        sieve[0] = sieve[1] = 0
+        for i in range(2, math.isqrt(size - 1) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, size, i)))
+        _sieve = sieve
+        _primes = [i for i, is_prime in enumerate(sieve) if is_prime]
+
+    return _primes[:bisect.bisect_right(_primes, limit)]
+
+
+def is_probable_prime(n: int) -> bool:
+    """
+    Test n for primality with the Miller-Rabin test.
+
+    The witnesses are the first twelve primes, which makes the answer exact
+    for n below 3.3e24; above that a composite is missed with negligible
+    probability.
+
+    Args:
+        n (int): Number to test.
+
+    Returns:
+        bool: True if n is (probably) prime.
+
+    Example:
+        >>> is_probable_prime(2**61 - 1), is_probable_prime(8051)
+        (True, False)
+    """
+    if n < 2:
+        return False
+    for p in _WITNESSES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in _WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def trial_division(n: int, limit: Optional[int] = None) -> Optional[Tuple[int, int]]:
+    """
+    Factor n by dividing it by every prime up to limit.
+
+    Args:
+        n (int): Number to factor.
+        limit (int | None): Largest trial divisor. Defaults to isqrt(n).
+
+    Returns:
+        Tuple[int, int] | None: (p, q) with p <= q and p * q = n, or None if no
+        factor was found below limit.
+
+    Example:
+        >>> trial_division(77)
+        (7, 11)
+    """
+    limit = math.isqrt(n) if limit is None else min(limit, math.isqrt(n))
+    for p in prime_sieve(limit):
+        if n % p == 0:
+            return p, n // p
+    return None
+
+
+def fermat(n: int, max_steps: int = FERMAT_STEPS) -> Optional[Tuple[int, int]]:
+    """
+    Factor an odd n by Fermat's method, which is fast when p and q are close.
+
+    Searches for a such that a² - n is a perfect square b², giving
+    n = (a - b)(a + b).
+
+    Args:
+        n (int): Odd number to factor.
+        max_steps (int): Number of values of a to try.
+
+    Returns:
+        Tuple[int, int] | None: (p, q) with p <= q, or None if the search ran out of steps.
+
+    Example:
+        >>> fermat(403)
+        (13, 31)
+    """
+    if n % 2 == 0:
+        return (2, n // 2) if n > 2 else None
+    a = math.isqrt(n)
+    if a * a < n:
+        a += 1
+    for _ in range(max_steps):
+        b2 = a * a - n
+        b = math.isqrt(b2)
+        if b * b == b2:
+            p = a - b
+            return (p, n // p) if p > 1 else None
+        a += 1
+    return None
+
+
+def pollard_rho_brent(
+    n: int, seed: Optional[int] = None, max_iterations: int = RHO_ITERATIONS
+) -> Optional[Tuple[int, int]]:
+    """
+    Factor n with Brent's variant of Pollard's rho method.
+
+    Expected running time grows with the square root of the smallest prime
+    factor, so it suits composite n with one small-to-medium factor. A strong
+    modulus (smallest factor well above max_iterations ** 2) is given up on
+    rather than searched for hours.
+
+    Args:
+        n (int): Composite number to factor.
+        seed (int | None): Seed for the random starting point.
+        max_iterations (int): Longest cycle to search, about a quarter of the
+            sequence steps one attempt may take.
+
+    Returns:
+        Tuple[int, int] | None: (p, q) with p <= q, or None if every attempt failed
+        or the iteration budget ran out.
+
+    Example:
+        >>> pollard_rho_brent(8051)
+        (83, 97)
+    """
+    if n % 2 == 0:
+        return (2, n // 2) if n > 2 else None
+
+    rng = random.Random(seed)
+    for _ in range(20):
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            if r > max_iterations:
+                return None  # other starting points would need as long
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # the batched product overshot; step back one value at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            p = min(g, n // g)
+            return p, n // p
+    return None
+
+
+METHODS: Dict[str, Callable[[int], Optional[Tuple[int, int]]]] = {
+    "trial_division": trial_division,
+    "fermat": fermat,
+    "pollard_rho_brent": pollard_rho_brent,
+}
+
+
+def factor_n(n: int, max_iterations: int = RHO_ITERATIONS) -> Tuple[int, int]:
+    """
+    Split an RSA modulus into two factors, choosing the method by the size of n.
+
+    Prime n are rejected up front by is_probable_prime(). Small n (below
+    TRIAL_DIVISION_LIMIT) go straight to trial division. Larger n first get a
+    bounded run of Fermat's method, for primes that sit close together, then
+    fall back to Pollard's rho (Brent variant), which gives up after
+    max_iterations.
+
+    Args:
+        n (int): RSA modulus.
+        max_iterations (int): Iteration budget for Pollard's rho.
+
+    Returns:
+        Tuple[int, int]: (p, q) with p <= q and p * q = n.
+
+    Raises:
+        ValueError: If n is not greater than 3, or is prime, or could not be factored within max_iterations.
+
+    Example:
+        >>> factor_n(find_n(13, 31))
+        (13, 31)
+    """
+    if n <= 3:
+        raise ValueError("n must be an integer greater than 3.")
+    if is_probable_prime(n):
+        raise ValueError(f"{n} is prime and cannot be split into two factors.")
+
+    if n < TRIAL_DIVISION_LIMIT:
+        result = trial_division(n)
+    else:
+        result = trial_division(n, 1000) or fermat(n) or pollard_rho_brent(n, max_iterations=max_iterations)
+
+    if result is None:
+        raise ValueError(f"Could not factor {n} within the iteration budget.")
+    return result
+
+
+def recover_private_key(n: int, e: int) -> Tuple[int, int, int, int]:
+    """
+    Recover the private key of a weak RSA key pair from its public half.
+
+    Args:
+        n (int): RSA modulus.
+        e (int): Public exponent.
+
+    Returns:
+        Tuple[int, int, int, int]: (p, q, φ(n), d), as find_totient() and find_d() would give.
+
+    Raises:
+        ValueError: If n cannot be factored or e has no inverse mod φ(n).
+
+    Example:
+        >>> recover_private_key(77, 7)
+        (7, 11, 60, 43)
+    """
+    p, q = factor_n(n)
+    phi_n = find_totient(p, q)
+    return p, q, phi_n, find_d(e, phi_n)
+
+
+def time_methods(
+    n: int, trial_limit: int = TRIAL_DIVISOR_LIMIT, max_iterations: int = RHO_ITERATIONS
+) -> Dict[str, Tuple[Optional[Tuple[int, int]], float]]:
+    """
+    Run every factoring method on n and report how long each took.
+
+    Trial division stops at trial_limit, since sieving up to isqrt(n) would
+    need isqrt(n) bytes of memory for a large n.
+
+    Args:
+        n (int): Composite number to factor.
+        trial_limit (int): Largest divisor trial division tries.
+        max_iterations (int): Iteration budget for Pollard's rho.
+
+    Returns:
+        Dict[str, Tuple[Tuple[int, int] | None, float]]: Method name mapped to
+        (factors, or None if the method gave up, elapsed seconds).
+
+    Raises:
+        ValueError: If n is prime, which Pollard's rho would spend its whole budget on.
+    """
+    if is_probable_prime(n):
+        raise ValueError(f"{n} is prime and cannot be split into two factors.")
+
+    timings = {}
+    for name, method in METHODS.items():
+        start = time.perf_counter()
+        if method is trial_division:
+            result = trial_division(n, trial_limit)
+        elif method is pollard_rho_brent:
+            result = pollard_rho_brent(n, max_iterations=max_iterations)
+        else:
+            result = method(n)
+        timings[name] = (result, time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    """
+    Demonstrates recovering private keys from the assignment moduli.
+    """
+    try:
+        for p, q in [(7, 11), (13, 31), (5, 11)]:
+            n = find_n(p, q)
+            e = find_e_any(find_totient(p, q))
+            p_found, q_found, phi_n, d = recover_private_key(n, e)
+            print(f"n = {n}, e = {e} -> p = {p_found}, q = {q_found}, phi_n = {phi_n}, d = {d}")
+
+        n = find_n(1000003, 1000033)
+        print(f"\nTiming for n = {n}:")
+        for name, (result, seconds) in time_methods(n).items():
+            print(f"{name}: {result} in {seconds * 1000:.3f} ms")
+
+    except ValueError as err:
+        print(f"[ERROR] {err}")
+
+
+if __name__ == "__main__":
+    main()
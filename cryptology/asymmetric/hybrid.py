@@ -0,0 +1,292 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import secrets
+from typing import Iterable, Iterator, Tuple
+from .rsa import find_n, find_totient, find_d
+from ..ciph_utils import Utils, Symbol_Set, UPPER_SPACE
+from ..symmetric.vigenere_cipher import vigenere_cipher
+
+DEFAULT_KEYWORD_LENGTH = 32
+KEY_START_INDEX = 2  # packed keywords are offset by 2, since 0 and 1 are unchanged by RSA
+LENGTH_BASE = 1 << 16  # packed keywords store their length in the lowest 16 bits
+MIN_PAD_BITS = 64  # least random padding (in bits) a packed keyword must get
+
+
+def generate_keyword(length: int, symbols: Symbol_Set = None) -> str:
+    """
+    Generate a random Vigenere keyword using a cryptographically secure source.
+
+    Args:
+        length (int): Number of characters.
+        symbols (Symbol_Set): Symbol set to draw from (defaults to printable ASCII).
+
+    Returns:
+        str: The keyword.
+
+    Raises:
+        ValueError: If length is not positive.
+    """
+    if length <= 0:
+        raise ValueError("Keyword length must be positive.")
+    symbols = Utils.default_set(symbols)
+    chars = symbols.symbols()
+    return "".join(secrets.choice(chars) for _ in range(length))
+
+
+def _pad_room(n: int, keyword_length: int, size: int) -> int:
+    """
+    Number of padding values that fit above every packed keyword of keyword_length characters.
+    """
+    keywords = size ** keyword_length
+    return ((n - 1 - KEY_START_INDEX - keyword_length) // LENGTH_BASE - (keywords - 1)) // keywords
+
+
+def pack_keyword(keyword: str, n: int, symbols: Symbol_Set = None) -> int:
+    """
+    Pack a keyword into one randomly padded integer below n, so RSA encrypts it with a single exponentiation.
+
+    From the low end, the integer holds the keyword length (base LENGTH_BASE),
+    the keyword's symbol indices (base symbols.size), then random padding from
+    the upper half of the room left below n. The result is offset by
+    KEY_START_INDEX. The padding keeps the value above n / 2, so its e-th power
+    always wraps mod n; otherwise an integer e-th root of the ciphertext would
+    give the keyword back without d (e.g. e = 3 and a short keyword).
+
+    Args:
+        keyword (str): Keyword made of characters in symbols.
+        n (int): RSA modulus the keyword will be encrypted under.
+        symbols (Symbol_Set): Symbol set of the keyword (defaults to printable ASCII).
+
+    Returns:
+        int: The packed keyword, in [n / 2, n).
+
+    Raises:
+        ValueError: If the keyword has characters outside symbols, or n leaves fewer
+            than 2 ** MIN_PAD_BITS padding values.
+
+    Example:
+        >>> unpack_keyword(pack_keyword("LEMON", 2**127 - 1, UPPER), UPPER)
+        'LEMON'
+    """
+    symbols = Utils.default_set(symbols)
+    table = symbols.index_table()
+    length = len(keyword)
+    room = _pad_room(n, length, symbols.size)
+    if length >= LENGTH_BASE or room < 1 << MIN_PAD_BITS:
+        raise ValueError(f"n = {n} is too small to pad a keyword of {length} characters.")
+
+    value = 0
+    for c in keyword:
+        if c not in table:
+            raise ValueError(f"Keyword character '{c}' is not in the symbol set.")
+        value = value * symbols.size + table[c]
+    pad = room // 2 + secrets.randbelow(room - room // 2)
+    return KEY_START_INDEX + length + LENGTH_BASE * (value + symbols.size ** length * pad)
+
+
+def unpack_keyword(value: int, symbols: Symbol_Set = None) -> str:
+    """
+    Inverse of pack_keyword(); the padding is discarded.
+
+    Args:
+        value (int): Packed keyword.
+        symbols (Symbol_Set): Symbol set of the keyword (defaults to printable ASCII).
+
+    Returns:
+        str: The keyword.
+
+    Raises:
+        ValueError: If value is not a packed keyword.
+    """
+    symbols = Utils.default_set(symbols)
+    value -= KEY_START_INDEX
+    if value < 0 or symbols.size < 2:
+        raise ValueError("Value is not a packed keyword.")
+    value, length = divmod(value, LENGTH_BASE)
+    if value < symbols.size ** length:
+        raise ValueError("Value is not a packed keyword.")  # no padding above the keyword
+    chars = []
+    for _ in range(length):
+        value, i = divmod(value, symbols.size)
+        chars.append(symbols[i])
+    return "".join(reversed(chars))
+
+
+def _check_modulus(n: int, keyword_length: int, symbols: Symbol_Set) -> None:
+    """
+    Raise ValueError if n is too small to pad every keyword of keyword_length characters.
+    """
+    def fits(length: int) -> bool:
+        return _pad_room(n, length, symbols.size) >= 1 << MIN_PAD_BITS
+
+    if not fits(keyword_length):
+        most = 0
+        while fits(most + 1):
+            most += 1
+        raise ValueError(
+            f"n = {n} is too small for a keyword of {keyword_length} characters from a "
+            f"symbol set of {symbols.size}; it fits keywords of at most {most} characters."
+        )
+
+
+def hybrid_encrypt(
+    message: str,
+    e: int,
+    n: int,
+    symbols: Symbol_Set = None,
+    keyword_length: int = DEFAULT_KEYWORD_LENGTH,
+) -> Tuple[int, str]:
+    """
+    Encrypt a message with a random Vigenere keyword, and only the keyword with RSA.
+
+    The keyword is packed into one randomly padded integer (pack_keyword())
+    and encrypted with a single modular exponentiation. Encrypting each symbol
+    on its own would let anyone holding (e, n) build a table of all
+    symbols.size encryptions and read the keyword off, and an unpadded value
+    with value ** e < n could be recovered with an integer e-th root. The
+    message itself goes through vigenere_cipher, whatever its size.
+
+    Args:
+        message (str): Plaintext, made of characters in symbols.
+        e (int): RSA public exponent.
+        n (int): RSA modulus, with room for the keyword and padding
+            (about symbols.size ** keyword_length * 2 ** (16 + MIN_PAD_BITS)).
+        symbols (Symbol_Set): Symbol set of the message (defaults to printable ASCII).
+        keyword_length (int): Length of the random keyword.
+
+    Returns:
+        Tuple[int, str]: (RSA-encrypted keyword, Vigenere ciphertext).
+
+    Raises:
+        ValueError: If e < 2, n is too small for the keyword, or the message has characters outside symbols.
+
+    Example:
+        >>> p, q = 2**89 - 1, 2**107 - 1
+        >>> d = find_d(65537, find_totient(p, q))
+        >>> enc_key, C = hybrid_encrypt("HELLO WORLD", 65537, p * q, UPPER_SPACE, keyword_length=8)
+        >>> hybrid_decrypt(enc_key, C, d, p * q, UPPER_SPACE)
+        'HELLO WORLD'
+    """
+    symbols = Utils.default_set(symbols)
+    if e < 2:
+        raise ValueError("e must be at least 2.")
+    _check_modulus(n, keyword_length, symbols)
+    keyword = generate_keyword(keyword_length, symbols)
+    packed = pack_keyword(keyword, n, symbols)
+    if e * (packed.bit_length() - 1) < n.bit_length() and packed ** e < n:
+        raise ValueError("The packed keyword would not wrap mod n; its e-th root would reveal it.")
+    return pow(packed, e, n), vigenere_cipher(message, keyword, True, symbols)
+
+
+def decrypt_keyword(enc_key: int, d: int, n: int, symbols: Symbol_Set = None) -> str:
+    """
+    Recover the Vigenere keyword from its RSA encryption.
+
+    Args:
+        enc_key (int): RSA-encrypted keyword from hybrid_encrypt().
+        d (int): RSA private exponent.
+        n (int): RSA modulus.
+        symbols (Symbol_Set): Symbol set of the message (defaults to printable ASCII).
+
+    Returns:
+        str: The keyword.
+
+    Raises:
+        ValueError: If enc_key is outside [0, n), or does not decrypt to a packed keyword (e.g. wrong d).
+    """
+    symbols = Utils.default_set(symbols)
+    if n <= 0 or d <= 0:
+        raise ValueError("RSA key and modulus must be positive.")
+    if not 0 <= enc_key < n:
+        raise ValueError(f"Encrypted keyword {enc_key} is outside valid range [0, n).")
+    try:
+        return unpack_keyword(pow(enc_key, d, n), symbols)
+    except ValueError:
+        raise ValueError("Decrypted keyword is not valid; check d and n.") from None
+
+
+def hybrid_decrypt(
+    enc_key: int, ciphertext: str, d: int, n: int, symbols: Symbol_Set = None
+) -> str:
+    """
+    Decrypt a message produced by hybrid_encrypt().
+
+    Args:
+        enc_key (int): RSA-encrypted keyword.
+        ciphertext (str): Vigenere ciphertext.
+        d (int): RSA private exponent.
+        n (int): RSA modulus.
+        symbols (Symbol_Set): Symbol set of the message (defaults to printable ASCII).
+
+    Returns:
+        str: The plaintext.
+
+    Raises:
+        ValueError: If the keyword cannot be recovered or the ciphertext has characters outside symbols.
+    """
+    symbols = Utils.default_set(symbols)
+    keyword = decrypt_keyword(enc_key, d, n, symbols)
+    return vigenere_cipher(ciphertext, keyword, False, symbols)
+
+
+def hybrid_decrypt_stream(
+    enc_key: int, chunks: Iterable[str], d: int, n: int, symbols: Symbol_Set = None
+) -> Iterator[str]:
+    """
+    Decrypt a hybrid ciphertext that arrives in pieces (e.g. read from a file).
+
+    The keyword is decrypted once. Each chunk is then decrypted with the keyword
+    rotated to the chunk's offset in the whole message, so chunks may have any
+    length and the joined output equals hybrid_decrypt() of the joined input.
+
+    Args:
+        enc_key (int): RSA-encrypted keyword.
+        chunks (Iterable[str]): Consecutive pieces of the Vigenere ciphertext.
+        d (int): RSA private exponent.
+        n (int): RSA modulus.
+        symbols (Symbol_Set): Symbol set of the message (defaults to printable ASCII).
+
+    Yields:
+        str: Plaintext for each chunk.
+
+    Raises:
+        ValueError: If the keyword cannot be recovered or a chunk has characters outside symbols.
+    """
+    symbols = Utils.default_set(symbols)
+    keyword = decrypt_keyword(enc_key, d, n, symbols)
+    offset = 0
+    for chunk in chunks:
+        phase = offset % len(keyword)
+        yield vigenere_cipher(chunk, keyword[phase:] + keyword[:phase], False, symbols)
+        offset += len(chunk)
+
+
+def main() -> None:
+    """
+    Demonstrates a hybrid RSA + Vigenere round trip with Mersenne primes p = 2^89 - 1 and q = 2^107 - 1.
+
+    The assignment key (n = 403) is too small to hold a packed keyword.
+    """
+    try:
+        p, q, e = 2**89 - 1, 2**107 - 1, 65537
+        n = find_n(p, q)
+        d = find_d(e, find_totient(p, q))
+
+        message = "HELLO WORLD THIS MESSAGE IS TOO LONG TO ENCRYPT ONE CHARACTER AT A TIME WITH RSA"
+        enc_key, C = hybrid_encrypt(message, e, n, UPPER_SPACE, keyword_length=8)
+        print(f"Message: {message}")
+        print(f"RSA-encrypted keyword: {enc_key}")
+        print(f"Vigenere ciphertext: {C}")
+        print(f"Decrypted: {hybrid_decrypt(enc_key, C, d, n, UPPER_SPACE)}")
+
+        pieces = [C[i:i + 10] for i in range(0, len(C), 10)]
+        print(f"Stream decrypted: {''.join(hybrid_decrypt_stream(enc_key, pieces, d, n, UPPER_SPACE))}")
+
+    except ValueError as err:
+        print(f"[ERROR] {err}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 # 2/5/26
 
 import math
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from ..ciph_utils import Utils, LOWER
 
 
@@ -145,12 +145,13 @@ def find_d(e: int, phi_n: int) -> int:
     return x % phi_n
 
 
-def encrypt(M_ord: List[int], key: int, n: int) -> List[int]:
+def encrypt(M_ord: Sequence[int], key: int, n: int) -> List[int]:
     """
     Encrypt a message using RSA modular exponentiation.
 
     Args:
-        M_ord (List[int]): Message encoded as integers.
+        M_ord (Sequence[int]): Message encoded as integers (a list, or an array
+            from Utils.ord_array()).
         key (int): RSA exponent (e or d).
         n (int): RSA modulus.
 
@@ -163,9 +164,9 @@ def encrypt(M_ord: List[int], key: int, n: int) -> List[int]:
     if n <= 0 or key <= 0:
         raise ValueError("RSA key and modulus must be positive.")
 
-    for m in M_ord:
-        if not (0 <= m < n):
-            raise ValueError(f"Message value {m} is outside valid range [0, n).")
+    if len(M_ord) and (min(M_ord) < 0 or max(M_ord) >= n):
+        m = next(m for m in M_ord if not (0 <= m < n))
+        raise ValueError(f"Message value {m} is outside valid range [0, n).")
 
     return [pow(m, key, n) for m in M_ord]
 
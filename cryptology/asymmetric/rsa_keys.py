@@ -0,0 +1,349 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import hashlib
+import mmap
+import struct
+from typing import Iterable, Iterator, List, Optional, Sequence
+from .rsa import find_n, find_totient, find_e_any, find_e_from_d, find_d, encrypt
+
+KEYRING_MAGIC = b"RSAKRNG1"
+_HEADER = struct.Struct(">8sI")   # magic, number of keys
+_ENTRY = struct.Struct(">QQI")    # key ID, record offset, record length
+_FIELD_LEN = struct.Struct(">H")  # byte length of each integer in a record
+
+
+class RSA_Key:
+    """
+    An RSA key pair with its CRT parameters precomputed.
+
+    Keys serialize to a compact binary record (to_bytes() / from_bytes()), so a
+    service can load them without redoing find_n, find_totient and find_d.
+    Many keys can be stored in one keyring file, see write_keyring() and Keyring.
+
+    Attributes:
+        n (int): RSA modulus p * q
+        e (int): Public exponent
+        d (int): Private exponent
+        p (int): First prime
+        q (int): Second prime
+        dp (int): d mod (p - 1)
+        dq (int): d mod (q - 1)
+        qinv (int): q⁻¹ mod p
+    """
+
+    __slots__ = ("n", "e", "d", "p", "q", "dp", "dq", "qinv")
+    _FIELDS = __slots__
+
+    def __init__(self, n: int, e: int, d: int, p: int, q: int, dp: int, dq: int, qinv: int):
+        """
+        Initialize a key from already-computed parameters (see from_primes() to derive them).
+        """
+        self.n, self.e, self.d = n, e, d
+        self.p, self.q = p, q
+        self.dp, self.dq, self.qinv = dp, dq, qinv
+
+    @classmethod
+    def from_primes(cls, p: int, q: int, e: Optional[int] = None, d: Optional[int] = None) -> "RSA_Key":
+        """
+        Derive a full key from its primes, doing the number theory once.
+
+        Args:
+            p (int): Prime number.
+            q (int): Prime number, different from p.
+            e (int | None): Public exponent. Found from d, or with find_e_any(), if omitted.
+            d (int | None): Private exponent. Found from e if omitted.
+
+        Returns:
+            RSA_Key: The key pair.
+
+        Raises:
+            ValueError: If p == q or the exponents are not valid for φ(n).
+
+        Example:
+            >>> RSA_Key.from_primes(5, 11, d=27).e
+            3
+        """
+        if p == q:
+            raise ValueError("p and q must be different primes.")
+        n = find_n(p, q)
+        phi_n = find_totient(p, q)
+        if e is None:
+            e = find_e_any(phi_n) if d is None else find_e_from_d(phi_n, d)
+        if d is None:
+            d = find_d(e, phi_n)
+        return cls(n, e, d, p, q, d % (p - 1), d % (q - 1), find_d(q % p, p))
+
+    @property
+    def key_id(self) -> int:
+        """
+        64-bit identifier derived from the public key (n, e).
+
+        Returns:
+            int: First 8 bytes of SHA-256 over n and e, as an unsigned integer.
+        """
+        digest = hashlib.sha256(_int_bytes(self.n) + b"|" + _int_bytes(self.e)).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def encrypt(self, M_ord: Sequence[int]) -> List[int]:
+        """
+        Encrypt integers with the public key (see rsa.encrypt).
+
+        Args:
+            M_ord (Sequence[int]): Message encoded as integers.
+
+        Returns:
+            List[int]: Encrypted message as integers.
+        """
+        return encrypt(M_ord, self.e, self.n)
+
+    def decrypt(self, C: Sequence[int]) -> List[int]:
+        """
+        Decrypt integers with the private key, using the Chinese Remainder Theorem.
+
+        Two half-size exponentiations (mod p and mod q) replace one full-size
+        exponentiation mod n.
+
+        Args:
+            C (Sequence[int]): Encrypted message as integers.
+
+        Returns:
+            List[int]: Decrypted message as integers.
+
+        Raises:
+            ValueError: If a value is outside [0, n).
+
+        Example:
+            >>> key = RSA_Key.from_primes(5, 11, d=27)
+            >>> key.decrypt(key.encrypt([1, 2, 3]))
+            [1, 2, 3]
+        """
+        if len(C) and (min(C) < 0 or max(C) >= self.n):
+            c = next(c for c in C if not (0 <= c < self.n))
+            raise ValueError(f"Message value {c} is outside valid range [0, n).")
+        p, q, dp, dq, qinv = self.p, self.q, self.dp, self.dq, self.qinv
+        result = []
+        for c in C:
+            m1 = pow(c, dp, p)
+            m2 = pow(c, dq, q)
+            result.append(m2 + (qinv * (m1 - m2) % p) * q)
+        return result
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the key to its binary record.
+
+        Each of n, e, d, p, q, dp, dq, qinv is written as a 2-byte length followed
+        by the integer in big-endian order.
+
+        Returns:
+            bytes: The record.
+        """
+        parts = []
+        for field in self._FIELDS:
+            raw = _int_bytes(getattr(self, field))
+            parts.append(_FIELD_LEN.pack(len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "RSA_Key":
+        """
+        Load a key from a record written by to_bytes().
+
+        Args:
+            data (bytes | memoryview): The record.
+
+        Returns:
+            RSA_Key: The key.
+
+        Raises:
+            ValueError: If the record is truncated or has trailing bytes.
+        """
+        values = []
+        offset = 0
+        try:
+            for _ in cls._FIELDS:
+                (length,) = _FIELD_LEN.unpack_from(data, offset)
+                offset += _FIELD_LEN.size
+                if offset + length > len(data):
+                    raise ValueError("RSA key record is truncated.")
+                values.append(int.from_bytes(data[offset:offset + length], "big"))
+                offset += length
+        except struct.error as err:
+            raise ValueError("RSA key record is truncated.") from err
+        if offset != len(data):
+            raise ValueError("RSA key record has trailing bytes.")
+        return cls(*values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RSA_Key):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._FIELDS)
+
+    def __repr__(self) -> str:
+        return f"RSA_Key(key_id={self.key_id:016x}, n={self.n}, e={self.e})"
+
+
+def _int_bytes(x: int) -> bytes:
+    """
+    Encode a non-negative integer in as few big-endian bytes as possible (at least one).
+    """
+    return x.to_bytes(max(1, (x.bit_length() + 7) // 8), "big")
+
+
+def write_keyring(path: str, keys: Iterable[RSA_Key]) -> int:
+    """
+    Write keys to a keyring file that Keyring can memory-map.
+
+    Layout: an 8-byte magic and key count, an index of (key ID, offset, length)
+    entries sorted by key ID, then the records from RSA_Key.to_bytes().
+
+    Args:
+        path (str): File to write.
+        keys (Iterable[RSA_Key]): Keys to store. Later keys replace earlier ones with the same ID.
+
+    Returns:
+        int: Number of keys written.
+    """
+    by_id = {key.key_id: key.to_bytes() for key in keys}
+    ids = sorted(by_id)
+
+    offset = _HEADER.size + _ENTRY.size * len(ids)
+    index = []
+    for key_id in ids:
+        index.append(_ENTRY.pack(key_id, offset, len(by_id[key_id])))
+        offset += len(by_id[key_id])
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(KEYRING_MAGIC, len(ids)))
+        f.write(b"".join(index))
+        for key_id in ids:
+            f.write(by_id[key_id])
+    return len(ids)
+
+
+class Keyring:
+    """
+    Read-only, memory-mapped access to a keyring file written by write_keyring().
+
+    Opening a keyring reads only its header. get() binary-searches the sorted
+    index in the mapped file, so only the requested key is decoded.
+
+    Attributes:
+        path (str): Keyring file
+    """
+
+    def __init__(self, path: str):
+        """
+        Open and memory-map a keyring file.
+
+        Args:
+            path: Keyring file
+
+        Raises:
+            ValueError: If the file is not a keyring
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is not an RSA keyring.")
+        magic, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != KEYRING_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not an RSA keyring.")
+
+    def _entry(self, i: int) -> tuple[int, int, int]:
+        """
+        Return the i-th (key ID, offset, length) index entry.
+        """
+        return _ENTRY.unpack_from(self._map, _HEADER.size + i * _ENTRY.size)
+
+    def _load(self, offset: int, length: int) -> RSA_Key:
+        """
+        Decode the record at offset.
+        """
+        with memoryview(self._map) as view:
+            return RSA_Key.from_bytes(bytes(view[offset:offset + length]))
+
+    def get(self, key_id: int) -> Optional[RSA_Key]:
+        """
+        Look up a key by ID.
+
+        Args:
+            key_id: ID as given by RSA_Key.key_id
+
+        Returns:
+            RSA_Key | None: The key, or None if it is not in the keyring
+        """
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            entry_id, offset, length = self._entry(mid)
+            if entry_id == key_id:
+                return self._load(offset, length)
+            if entry_id < key_id:
+                low = mid + 1
+            else:
+                high = mid
+        return None
+
+    def __contains__(self, key_id: int) -> bool:
+        return self.get(key_id) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[RSA_Key]:
+        """
+        Iterate over every key, in key ID order.
+        """
+        for i in range(self._count):
+            _, offset, length = self._entry(i)
+            yield self._load(offset, length)
+
+    def close(self) -> None:
+        """
+        Unmap the keyring file.
+        """
+        self._map.close()
+
+    def __enter__(self) -> "Keyring":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main() -> None:
+    """
+    Demonstrates saving the assignment keys to a keyring and loading one back by ID.
+    """
+    import os
+    import tempfile
+
+    try:
+        keys = [
+            RSA_Key.from_primes(7, 11),
+            RSA_Key.from_primes(13, 31, d=7),
+            RSA_Key.from_primes(5, 11, d=27),
+        ]
+        path = os.path.join(tempfile.mkdtemp(), "demo.keyring")
+        write_keyring(path, keys)
+        print(f"Wrote {len(keys)} keys ({os.path.getsize(path)} bytes) to {path}")
+
+        with Keyring(path) as ring:
+            key = ring.get(keys[2].key_id)
+            print(f"Loaded {key}")
+            C = key.encrypt([1, 2, 3])
+            print(f"Encrypted [1, 2, 3]: {C}, CRT decrypted: {key.decrypt(C)}")
+
+    except ValueError as err:
+        print(f"[ERROR] {err}")
+
+
+if __name__ == "__main__":
+    main()
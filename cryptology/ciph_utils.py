@@ -2,6 +2,13 @@
 # CSC-348 Computer Security
 # 1/24/26
 
+import hashlib
+from array import array
+from collections import Counter
+from itertools import repeat
+from operator import mul
+
+
 class Symbol_Set:
     """
     A class that reconciles the differences in representation between a
@@ -61,6 +68,9 @@ class Symbol_Set:
             raise TypeError(
                 f"Symbol_Set must be initialized with a tuple or string. Got {symbols} of type: {type(symbols)}"
             )
+        self._index_table = None
+        self._code_tables = {}
+        self._mask = None
 
     def index(self, c: str) -> int:
         """
@@ -90,11 +100,12 @@ class Symbol_Set:
                 raise ValueError(f"{c!r} out of range {self.low}-{self.high}")
             return o - self.low
         else:
-            if c not in self.allowed:
+            idx = self.index_table().get(c)
+            if idx is None:
                 raise ValueError(
                     f"{c!r} not in allowed symbols {''.join(self.allowed)!r}"
                 )
-            return self.allowed.index(c)
+            return idx
 
     def __getitem__(self, idx: int) -> str:  # overrides python's [] operator
         """
@@ -163,6 +174,283 @@ class Symbol_Set:
         else:
             return self.allowed
 
+    def mask(self) -> int:
+        """
+        Return a bitmap of the symbol set, with bit ord(c) set for every character c (cached).
+        
+        Example:
+            >>> bin(Symbol_Set("AC").mask() >> 65)
+            '0b101'
+        """
+        if self._mask is None:
+            if self.is_range:
+                self._mask = ((1 << self.size) - 1) << self.low
+            else:
+                self._mask = 0
+                for c in self.allowed:
+                    self._mask |= 1 << ord(c)
+        return self._mask
+
+    def index_table(self) -> dict[str, int]:
+        """
+        Return a {character: index} lookup table for the symbol set, built once and cached.
+        
+        Returns:
+            dict[str, int]: Zero-based index of every character (first occurrence wins)
+        
+        Example:
+            >>> Symbol_Set("ABC").index_table()
+            {'A': 0, 'B': 1, 'C': 2}
+        """
+        if self._index_table is None:
+            symbols = self.symbols()
+            self._index_table = {symbols[i]: i for i in range(self.size - 1, -1, -1)}
+        return self._index_table
+
+    def code_table(self, start_index: int | None = None) -> dict[str, int]:
+        """
+        Return a cached {character: code} table matching Utils.ord_str() encodings.
+        
+        Args:
+            start_index:
+                - None (default): codes are ASCII values via ord(c)
+                - int k: codes are symbol indices starting at k
+        
+        Returns:
+            dict[str, int]: Code of every character in the symbol set
+        
+        Example:
+            >>> LOWER.code_table(1)["c"]
+            3
+        """
+        table = self._code_tables.get(start_index)
+        if table is None:
+            if start_index is None:
+                table = {c: ord(c) for c in self.index_table()}
+            else:
+                table = {c: i + start_index for c, i in self.index_table().items()}
+            self._code_tables[start_index] = table
+        return table
+
+
+class Column_View:
+    """
+    A read-only, strided view of one column of an index-encoded ciphertext.
+    
+    Created by Utils.column_views(). The view shares its buffer with the encoded
+    ciphertext, so building columns for many key lengths copies no text.
+    Characters outside the Symbol_Set are stored as the sentinel symbols.size,
+    which keeps column positions identical to Utils.columnize().
+    
+    Attributes:
+        codes (memoryview): Symbol indices of the characters in this column
+        symbols (Symbol_Set): Symbol set the indices refer to
+    """
+
+    def __init__(self, codes: memoryview, symbols: Symbol_Set):
+        """
+        Initialize a view over already-encoded symbol indices.
+        
+        Args:
+            codes: memoryview of symbol indices (usually a strided slice)
+            symbols: Symbol_Set the indices refer to
+        """
+        self.codes = codes
+        self.symbols = symbols
+
+    def __len__(self) -> int:
+        """
+        Return the number of positions in the column, including out-of-set characters.
+        """
+        return len(self.codes)
+
+    def __iter__(self):
+        """
+        Iterate over the characters in the column that belong to the Symbol_Set.
+        """
+        size = self.symbols.size
+        return (self.symbols[d] for d in self.codes if d < size)
+
+    def __str__(self) -> str:
+        """
+        Return the column's in-set characters as a new string (allocates; for display).
+        
+        Example:
+            >>> [str(v) for v in Utils.column_views("ABCDEF", 2, Symbol_Set("ABCDEF"))]
+            ['ACE', 'BDF']
+        """
+        return "".join(self)
+
+    def counts(self) -> list[int]:
+        """
+        Count occurrences of each symbol index in the column.
+        
+        Returns:
+            list[int]: counts[i] is the number of times symbols[i] appears
+        """
+        tally = Counter(self.codes)
+        return [tally.get(i, 0) for i in range(self.symbols.size)]
+
+
+class Frequency_Table:
+    """
+    A character distribution stored as a dense array aligned to a Symbol_Set.
+    
+    values[i] belongs to symbols[i], so two tables over the same Symbol_Set can
+    be combined position by position without re-keying dictionaries. Tables
+    convert to and from the {character: value} dictionaries used elsewhere in
+    the package (see from_dict() and to_dict()).
+    
+    Attributes:
+        symbols (Symbol_Set): Symbol set the values are aligned to
+        values (array): One float ('d') per symbol, counts or frequencies
+    """
+
+    __slots__ = ("symbols", "values")
+
+    def __init__(self, symbols: Symbol_Set = None, values=None):
+        """
+        Initialize a table, all zeros unless values are given.
+        
+        Args:
+            symbols: Symbol_Set the table is aligned to (defaults to printable ASCII)
+            values: Optional iterable of symbols.size numbers
+        
+        Raises:
+            ValueError: If values does not have exactly symbols.size entries
+        """
+        self.symbols = Utils.default_set(symbols)
+        if values is None:
+            self.values = array("d", bytes(8 * self.symbols.size))
+        else:
+            self.values = array("d", values)
+            if len(self.values) != self.symbols.size:
+                raise ValueError(
+                    f"Expected {self.symbols.size} values, got {len(self.values)}"
+                )
+
+    @classmethod
+    def from_dict(cls, dist: dict[str, float], symbols: Symbol_Set = None) -> "Frequency_Table":
+        """
+        Build a table from a {character: value} dictionary.
+        
+        Characters missing from dist get 0.0, and keys outside symbols are ignored.
+        
+        Example:
+            >>> Frequency_Table.from_dict({'A': 0.5, 'C': 0.5}, Symbol_Set("ABC")).to_dict()
+            {'A': 0.5, 'B': 0.0, 'C': 0.5}
+        """
+        symbols = Utils.default_set(symbols)
+        return cls(symbols, (dist.get(c, 0.0) for c in symbols.symbols()))
+
+    @classmethod
+    def from_text(cls, text: str | Column_View, symbols: Symbol_Set = None) -> "Frequency_Table":
+        """
+        Count every symbol in a string or Column_View (characters outside symbols are ignored).
+        
+        Example:
+            >>> Frequency_Table.from_text("AABBC", Symbol_Set("ABC")).to_dict()
+            {'A': 2.0, 'B': 2.0, 'C': 1.0}
+        """
+        symbols = Utils.default_set(symbols)
+        if isinstance(text, Column_View):
+            return cls(symbols, Utils.count_chars(text, symbols).values())
+        tally = Counter(text)
+        return cls(symbols, (tally.get(c, 0) for c in symbols.symbols()))
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        Return the table as a {character: value} dictionary, in symbol order.
+        """
+        return dict(zip(self.symbols.symbols(), self.values))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, c: str) -> float:
+        """
+        Return the value for character c.
+        
+        Raises:
+            ValueError: If c is not in the symbol set
+        """
+        return self.values[self.symbols.index(c)]
+
+    def __repr__(self) -> str:
+        return f"Frequency_Table({self.to_dict()!r})"
+
+    def _check(self, other: "Frequency_Table") -> None:
+        """
+        Raise ValueError unless other is aligned to the same symbols.
+        """
+        if other.symbols is not self.symbols and other.symbols.symbols() != self.symbols.symbols():
+            raise ValueError("Frequency_Tables are aligned to different Symbol_Sets")
+
+    def total(self) -> float:
+        """
+        Return the sum of all values.
+        """
+        return sum(self.values)
+
+    def normalize(self) -> "Frequency_Table":
+        """
+        Return a copy scaled so the values sum to 1 (all zeros stay zeros).
+        """
+        total = self.total()
+        if total == 0:
+            return Frequency_Table(self.symbols, self.values)
+        return Frequency_Table(self.symbols, (v / total for v in self.values))
+
+    def rotate(self, shift: int) -> "Frequency_Table":
+        """
+        Return the distribution of the same text caesar-shifted by shift.
+        
+        Example:
+            >>> Frequency_Table(Symbol_Set("ABC"), [3, 2, 1]).rotate(1).to_dict()
+            {'A': 1.0, 'B': 3.0, 'C': 2.0}
+        """
+        k = shift % len(self.values)
+        return Frequency_Table(self.symbols, self.values[-k:] + self.values[:-k] if k else self.values)
+
+    def dot(self, other: "Frequency_Table") -> float:
+        """
+        Return the sum of the position-wise products with other.
+        """
+        self._check(other)
+        return sum(map(mul, self.values, other.values))
+
+    def cross_correlation(self, other: "Frequency_Table") -> list[float]:
+        """
+        Return self.dot(other.rotate(i)) for every shift i, as cryptanalysis.cross_correlation() does.
+        """
+        self._check(other)
+        v1, v2 = self.values, other.values
+        n = len(v2)
+        return [sum(map(mul, v1, v2[n - i:] + v2[:n - i])) for i in range(n)]
+
+    def chi_squared(self, expected: "Frequency_Table") -> float:
+        """
+        Return the chi-squared statistic of these observed counts against an expected distribution.
+        
+        expected is scaled to the same total as self. Symbols expected never to
+        appear are skipped.
+        """
+        self._check(expected)
+        scale = self.total() / (expected.total() or 1)
+        chi = 0.0
+        for o, e in zip(self.values, expected.values):
+            e *= scale
+            if e > 0:
+                chi += (o - e) ** 2 / e
+        return chi
+
+    def merge(self, other: "Frequency_Table") -> "Frequency_Table":
+        """
+        Return a table with the values of self and other added together (e.g. combined counts).
+        """
+        self._check(other)
+        return Frequency_Table(self.symbols, map(float.__add__, self.values, other.values))
+
 
 class Utils:
     """
@@ -267,6 +555,116 @@ class Utils:
         return "".join(symbols[d - start_index] for d in ord_message)
 
 
+    @staticmethod
+    def _typecode(low: int, high: int) -> str:
+        """
+        Pick the smallest array typecode that can hold every value in [low, high].
+        
+        Args:
+            low: Smallest value to store
+            high: Largest value to store
+        
+        Returns:
+            str: array typecode ('B', 'H', 'L', 'b', 'h', 'l' or 'q')
+        
+        Raises:
+            OverflowError: If the values do not fit in a signed 64-bit integer
+        """
+        if low >= 0:
+            for typecode, limit in (("B", 1 << 8), ("H", 1 << 16), ("L", 1 << 32)):
+                if high < limit:
+                    return typecode
+        for typecode, limit in (("b", 1 << 7), ("h", 1 << 15), ("l", 1 << 31), ("q", 1 << 63)):
+            if -limit <= low and high < limit:
+                return typecode
+        raise OverflowError(f"Values in [{low}, {high}] do not fit in a 64-bit array")
+
+    @staticmethod
+    def ord_array(
+        message: str,
+        symbols: Symbol_Set = None,
+        *,
+        start_index: int | None = None
+    ) -> array:
+        """
+        Bulk version of ord_str() that returns a compact array.array instead of a list.
+        
+        Encoding goes through the Symbol_Set's cached code table, and the array
+        uses the smallest typecode that fits the codes (one byte per character for
+        every predefined symbol set), instead of a full Python int per character.
+        
+        Args:
+            message: String to convert
+            symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+            start_index:
+                - None (default): return ASCII values via ord(c)
+                - int k: return symbol indices starting at k
+        
+        Returns:
+            array: Same values as ord_str(), characters outside symbols are skipped
+        
+        Example:
+            >>> Utils.ord_array("abc", LOWER, start_index=1)
+            array('B', [1, 2, 3])
+        """
+        symbols = Utils.default_set(symbols)
+        table = symbols.code_table(start_index)
+        codes = table.values()
+        typecode = Utils._typecode(min(codes), max(codes))
+        return array(typecode, map(table.__getitem__, filter(table.__contains__, message)))
+
+    @staticmethod
+    def chr_array(
+        ord_message: array | list[int],
+        symbols: Symbol_Set = None,
+        *,
+        start_index: int | None = None
+    ) -> str:
+        """
+        Bulk version of chr_str() that accepts an array.array (or any int sequence).
+        
+        Validation is done once over the whole input (its min and max) rather
+        than per element, and decoding uses precomputed lookup tables.
+        
+        Args:
+            ord_message: Integers to convert
+            symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+            start_index:
+                - None (default): interpret values as ASCII codes
+                - int k: interpret values as symbol indices starting at k
+        
+        Returns:
+            str: Same string chr_str() returns for the same input
+        
+        Raises:
+            ValueError: If a value is below start_index when using index mode
+        
+        Example:
+            >>> Utils.chr_array(array("B", [1, 2, 3]), LOWER, start_index=1)
+            'abc'
+        """
+        symbols = Utils.default_set(symbols)
+        if len(ord_message) == 0:
+            return ""
+        low, high = min(ord_message), max(ord_message)
+
+        if start_index is None:
+            if symbols.is_range and symbols.low <= low and high <= symbols.high and high < 256:
+                # every value is a valid latin-1 byte in the set
+                return array("B", ord_message).tobytes().decode("latin-1")
+            decode = {d: c for c, d in symbols.code_table().items()}
+            return "".join(map(decode.get, ord_message, repeat("")))
+
+        if low < start_index:
+            raise ValueError("Encoded value below start_index")
+
+        chars = symbols.symbols()
+        if start_index:
+            ord_message = map(start_index.__rsub__, ord_message)
+        if high - start_index >= symbols.size:
+            ord_message = map(symbols.size.__rmod__, ord_message)  # wrap around, as symbols[i] does
+        return "".join(map(chars.__getitem__, ord_message))
+
     @staticmethod
     def shift_ord(d: int, shift: int, symbols: Symbol_Set = None) -> int:
         """
@@ -331,22 +729,32 @@ class Utils:
         return {c: 0 for c in symbols.symbols()}
 
     @staticmethod
-    def count_chars(ciphertext: str, symbols: Symbol_Set = None) -> dict[str, int]:
+    def count_chars(ciphertext: str | Column_View, symbols: Symbol_Set = None) -> dict[str, int]:
         """
         Count the occurrences in the ciphertext of all valid characters
         
         Args:
-            ciphertext: String to analyze
-            symbols: Symbol_Set defining which characters to count (defaults to printable ASCII)
+            ciphertext: String or Column_View to analyze
+            symbols: Symbol_Set defining which characters to count (defaults to printable ASCII).
+                     A Column_View must have been encoded with the same symbols.
         
         Returns:
             dict[str, int]: Dictionary mapping characters to their counts in ciphertext
         
+        Raises:
+            ValueError: If a Column_View was encoded with a different Symbol_Set
+        
         Example:
             >>> Utils.count_chars("AABBC", Symbol_Set("ABC"))
             {'A': 2, 'B': 2, 'C': 1}
         """
         symbols = Utils.default_set(symbols)
+        if isinstance(ciphertext, Column_View):
+            if ciphertext.symbols is not symbols and ciphertext.symbols.symbols() != symbols.symbols():
+                raise ValueError("Column_View was encoded with a different Symbol_Set")
+            counts = ciphertext.counts()
+            return {c: counts[i] for i, c in enumerate(symbols.symbols())}
+
         counts = Utils._init_count_dict(symbols)
         for c in ciphertext:
             if c in symbols:
@@ -391,6 +799,58 @@ class Utils:
             cols[i % size].append(c)
         return ["".join(col) for col in cols]
 
+    @staticmethod
+    def encode_indices(message: str, symbols: Symbol_Set = None) -> array:
+        """
+        Encode a message as a compact array of symbol indices, one per character.
+        
+        Characters outside the Symbol_Set are kept in place as the sentinel
+        symbols.size so that positions (and therefore columns) are preserved.
+        
+        Args:
+            message: String to encode
+            symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        
+        Returns:
+            array: Unsigned byte array ('B'), or 'H' for symbol sets of 255 or more characters
+        
+        Example:
+            >>> list(Utils.encode_indices("AB?C", Symbol_Set("ABC")))
+            [0, 1, 3, 2]
+        """
+        symbols = Utils.default_set(symbols)
+        typecode = "B" if symbols.size < 255 else "H"
+        return array(typecode, map(symbols.index_table().get, message, repeat(symbols.size)))
+
+    @staticmethod
+    def column_views(
+        enc_message: str | array, size: int, symbols: Symbol_Set = None
+    ) -> list[Column_View]:
+        """
+        Split the encrypted message into 'size' zero-copy column views.
+        
+        Same columns as columnize(), but each column is a strided memoryview over
+        one shared index-encoded buffer instead of a new string. Pass an array from
+        encode_indices() to reuse one encoding across many key lengths.
+        
+        Args:
+            enc_message: Encrypted message, or its encode_indices() array
+            size: Number of columns to create (key length in Vigenere analysis)
+            symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        
+        Returns:
+            list[Column_View]: One view per column
+        
+        Example:
+            >>> [str(v) for v in Utils.column_views("ABCDEF", 2, Symbol_Set("ABCDEF"))]
+            ['ACE', 'BDF']
+        """
+        symbols = Utils.default_set(symbols)
+        if isinstance(enc_message, str):
+            enc_message = Utils.encode_indices(enc_message, symbols)
+        codes = memoryview(enc_message)
+        return [Column_View(codes[i::size], symbols) for i in range(size)]
+
 ASCII_PRINTABLES = Symbol_Set((32, 126))
 UPPER = Symbol_Set("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 LOWER = Symbol_Set("abcdefghijklmnopqrstuvwxyz")
@@ -398,3 +858,65 @@ UPPER_SPACE = Symbol_Set("ABCDEFGHIJKLMNOPQRSTUVWXYZ ")
 LOWER_SPACE = Symbol_Set("abcdefghijklmnopqrstuvwxyz ")
 HEX = Symbol_Set("ABCDEF")
 ALPHA_SPACE = Symbol_Set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ")
+
+# Symbol sets considered by detect_symbol_set(), see register_symbol_set()
+SYMBOL_SET_REGISTRY = [ASCII_PRINTABLES, UPPER, LOWER, UPPER_SPACE, LOWER_SPACE, HEX, ALPHA_SPACE]
+DETECT_CACHE_SIZE = 1024  # fingerprints remembered by detect_symbol_set()
+_detect_cache: dict[bytes, Symbol_Set] = {}
+
+
+def register_symbol_set(symbols: Symbol_Set) -> None:
+    """
+    Add a Symbol_Set to the ones detect_symbol_set() chooses from.
+    
+    Args:
+        symbols: Symbol_Set to register
+    """
+    if symbols not in SYMBOL_SET_REGISTRY:
+        SYMBOL_SET_REGISTRY.append(symbols)
+        _detect_cache.clear()
+
+
+def detect_symbol_set(text: str) -> Symbol_Set:
+    """
+    Pick the smallest registered Symbol_Set that contains every character of text.
+    
+    The text is scanned once into a bitmap of the characters present, which is
+    then tested against each registered set's mask(). Results are cached by a
+    fingerprint of the text, so repeated ciphertexts are not scanned again.
+    
+    Args:
+        text: Ciphertext (or any string) to inspect
+    
+    Returns:
+        Symbol_Set: Smallest covering set (earliest registered on ties)
+    
+    Raises:
+        ValueError: If text is empty (every set would cover it, so the answer would be
+            arbitrary), or no registered Symbol_Set covers the text
+    
+    Example:
+        >>> detect_symbol_set("HELLO WORLD") is UPPER_SPACE
+        True
+    """
+    if not text:
+        raise ValueError("Cannot detect a Symbol_Set from empty text")
+
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    found = _detect_cache.get(key)
+    if found is not None:
+        return found
+
+    present = 0
+    for c in set(text):
+        present |= 1 << ord(c)
+
+    candidates = [s for s in SYMBOL_SET_REGISTRY if present & ~s.mask() == 0]
+    if not candidates:
+        raise ValueError("No registered Symbol_Set contains every character of the text")
+    found = min(candidates, key=lambda s: s.size)
+
+    if len(_detect_cache) >= DETECT_CACHE_SIZE:
+        del _detect_cache[next(iter(_detect_cache))]  # drop the oldest entry
+    _detect_cache[key] = found
+    return found
@@ -0,0 +1,155 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+from ..ciph_utils import Utils, Symbol_Set
+
+
+def implied_shifts(enc_message: str, crib: str, symbols: Symbol_Set = None) -> list[bytes | list[int]]:
+    """
+    Computes the key shifts implied by placing the crib at every offset of the ciphertext at once.
+
+    Row k holds, for every offset o, the shift (c[o + k] - p[k]) mod symbols.size
+    that would turn crib character k into the ciphertext character under it.
+    Each row is one bytes.translate() over the whole ciphertext, so the work
+    runs in C rather than per character.
+
+    Args:
+        enc_message: Vigenere ciphertext
+        crib: Plaintext believed to appear somewhere in the message
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+
+    Returns:
+        list[bytes | list[int]]: len(crib) rows of len(enc_message) - len(crib) + 1 shifts
+        (bytes when the symbol set has at most 256 characters)
+
+    Raises:
+        ValueError: If the crib has a character outside symbols
+
+    Example:
+        >>> [list(row) for row in implied_shifts("BD", "A", Symbol_Set("ABCD"))]
+        [[1, 3]]
+    """
+    symbols = Utils.default_set(symbols)
+    size = symbols.size
+    crib_idx = [symbols.index(c) for c in crib]
+    codes = Utils.ord_array(enc_message, symbols, start_index=0)
+    m = len(codes) - len(crib) + 1
+    if m <= 0:
+        return [b"" for _ in crib_idx]
+
+    if codes.typecode == "B":
+        cipher = codes.tobytes()
+        rows = []
+        for k, p in enumerate(crib_idx):
+            table = bytes((i - p) % size if i < size else 0 for i in range(256))
+            rows.append(cipher[k:k + m].translate(table))
+        return rows
+    return [[(c - p) % size for c in codes[k:k + m]] for k, p in enumerate(crib_idx)]
+
+
+def find_crib(
+    enc_message: str,
+    crib: str,
+    symbols: Symbol_Set = None,
+    *,
+    max_period: int | None = None,
+) -> list[tuple[int, str]]:
+    """
+    Recovers candidate Vigenere keywords from a probable word (crib) in the plaintext.
+
+    At the crib's true position the implied shifts repeat with the keyword
+    length. Every offset is checked for the shortest period P (up to max_period)
+    at which its shifts repeat, and that period's shifts are rotated back into
+    a keyword that starts at message position 0.
+
+    Args:
+        enc_message: Vigenere ciphertext. Offsets count only characters in symbols.
+        crib: Plaintext believed to appear somewhere in the message
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        max_period: Longest keyword to look for. Defaults to len(crib) // 2, so the crib
+                    spans the keyword at least twice.
+
+    Returns:
+        list[tuple[int, str]]: (offset of the crib, candidate keyword), in offset order
+
+    Raises:
+        ValueError: If the crib has a character outside symbols
+
+    Example:
+        >>> C = vigenere_cipher("MEET ME AT THE USUAL PLACE AT NOON", "LEMON", True, UPPER_SPACE)
+        >>> find_crib(C, "THE USUAL PLACE", UPPER_SPACE)
+        [(11, 'LEMON')]
+    """
+    symbols = Utils.default_set(symbols)
+    length = len(crib)
+    if max_period is None:
+        max_period = length // 2
+    max_period = min(max_period, length - 1)
+
+    rows = implied_shifts(enc_message, crib, symbols)
+    periods = {}  # offset -> shortest period found
+    as_ints = {}  # rows converted to big integers, shared between periods
+    for period in range(1, max_period + 1):
+        for offset in _periodic_offsets(rows, period, as_ints):
+            periods.setdefault(offset, period)
+
+    candidates = []
+    for offset in sorted(periods):
+        period = periods[offset]
+        keyword = [""] * period
+        for j in range(period):
+            keyword[(offset + j) % period] = symbols[rows[j][offset]]
+        candidates.append((offset, "".join(keyword)))
+    return candidates
+
+
+_ZERO_TO_ONE = bytes([1] + [0] * 255)  # translate table: 1 where a byte is 0, else 0
+
+
+def _periodic_offsets(rows: list[bytes | list[int]], period: int, as_ints: dict[int, int]) -> list[int]:
+    """
+    Returns the offsets whose implied shifts repeat with the given period.
+
+    For bytes rows the test runs over all offsets at once: rows k and k + period
+    are XORed as big integers, zero bytes (equal shifts) are turned into 1s with
+    translate(), and the results are ANDed together.
+
+    Args:
+        rows: Output of implied_shifts()
+        period: Period to test
+        as_ints: Cache of rows already converted with int.from_bytes(), keyed by row number
+
+    Returns:
+        list[int]: Matching offsets, ascending
+    """
+    m = len(rows[0]) if rows else 0
+    if m == 0 or period >= len(rows):
+        return []
+
+    if not isinstance(rows[0], bytes):
+        return [
+            offset for offset, shifts in enumerate(zip(*rows))
+            if shifts[period:] == shifts[:-period]
+        ]
+
+    mask = (1 << (8 * m)) - 1
+    checked = 0
+    for k in range(len(rows) - period):
+        for row in (k, k + period):
+            if row not in as_ints:
+                as_ints[row] = int.from_bytes(rows[row], "big")
+        equal = (as_ints[k] ^ as_ints[k + period]).to_bytes(m, "big").translate(_ZERO_TO_ONE)
+        mask &= int.from_bytes(equal, "big")
+        checked = k + 1
+        if mask.bit_count() <= m >> 6:
+            break  # few offsets left; checking them one by one is cheaper
+
+    flags = mask.to_bytes(m, "big")
+    offsets = []
+    offset = flags.find(1)
+    while offset != -1:
+        if all(rows[k][offset] == rows[k + period][offset] for k in range(checked, len(rows) - period)):
+            offsets.append(offset)
+        offset = flags.find(1, offset + 1)
+    return offsets
@@ -2,17 +2,23 @@
 # CSC-348 Computer Security
 # 1/25/26
 
-from ..ciph_utils import Utils, Symbol_Set
+from array import array
+from ..ciph_utils import Utils, Symbol_Set, Column_View, Frequency_Table
 from .caesar_cipher import caesar_cipher
 from .vigenere_cipher import vigenere_cipher
+from .result_store import Result_Store
 
+KNOWN_KEY_SAMPLE = 2000  # characters decrypted when trying a stored keyword on a new message
+ADAPTIVE_INITIAL_SAMPLE = 256  # characters (per column) in the first adaptive sample
+ADAPTIVE_CONFIDENCE = 0.25  # relative gap between the best and second-best shift needed to stop sampling
 
-def frequency_analysis(message: str, symbols: Symbol_Set = None) -> dict[str, float]:
+
+def frequency_analysis(message: str | Column_View, symbols: Symbol_Set = None) -> dict[str, float]:
     """
     Creates a dictionary for characters and their frequencies within a message.
     
     Args:
-        message: String to analyze for character frequencies
+        message: String or Column_View to analyze for character frequencies
         symbols: Symbol_Set defining which characters to analyze (defaults to printable ASCII)
     
     Returns:
@@ -23,11 +29,7 @@ def frequency_analysis(message: str, symbols: Symbol_Set = None) -> dict[str, fl
         {'A': 0.666..., 'B': 0.333..., 'C': 0.0}
     """
     symbols = Utils.default_set(symbols)
-    counts = Utils.count_chars(message, symbols)
-    total = sum(counts.values())
-    if total == 0:
-        return {c: 0.0 for c in symbols.symbols()}
-    return {c: counts[c] / total for c in symbols.symbols()}
+    return Frequency_Table.from_text(message, symbols).normalize().to_dict()
 
 
 def cross_correlation(
@@ -52,30 +54,27 @@ def cross_correlation(
         [0.38, 0.31, 0.31]  # Highest value at shift 0 indicates best match at no shift
     """
     symbols = Utils.default_set(symbols)
-    n = symbols.size
 
     # allows dict1 and dict2 to have a symbol set that is a subset of 'symbols'
-    freq1 = {c: dict1.get(c, 0.0) for c in symbols.symbols()}
-    freq2 = {c: dict2.get(c, 0.0) for c in symbols.symbols()}
-    vals2 = list(freq2.values())  # apparently freq2.values() is a view, not a list, so you need to explicitly cast it
-    phi = [0.0] * n
-
-    for i in range(n):
-        for j, c in enumerate(symbols.symbols()):
-            phi[i] += freq1[c] * vals2[(j - i) % n]
-    return phi
+    freq1 = Frequency_Table.from_dict(dict1, symbols)
+    freq2 = Frequency_Table.from_dict(dict2, symbols)
+    return freq1.cross_correlation(freq2)
 
 
 def get_caesar_shift(
-    enc_message: str, expected_dist: dict[str, float], symbols: Symbol_Set = None
+    enc_message: str | Column_View,
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set = None,
+    store: Result_Store = None,
 ) -> int:
     """
     Gets the likely shift used to originally encrypt a caesar cipher.
     
     Args:
-        enc_message: Encrypted ciphertext to analyze
+        enc_message: Encrypted ciphertext (or a Column_View of one) to analyze
         expected_dist: Dictionary of expected character frequencies for the language
         symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        store: Optional Result_Store checked before analysis and updated after it
     
     Returns:
         int: Most likely Caesar cipher shift value (0 to n-1 where n is symbol set size)
@@ -90,26 +89,93 @@ def get_caesar_shift(
         Any difference in size between the symbol sets will muddle the modular arithmetic.
     """
     symbols = Utils.default_set(symbols)
-    cc = cross_correlation(
-        frequency_analysis(enc_message, symbols), expected_dist, symbols
-    )
-    return cc.index(max(cc))
+    if store is not None:
+        hit = store.lookup(enc_message, symbols, "caesar", 1)
+        if hit is not None:
+            return int(hit[0])
+
+    expected = Frequency_Table.from_dict(expected_dist, symbols)
+    cc = Frequency_Table.from_text(enc_message, symbols).normalize().cross_correlation(expected)
+    shift = cc.index(max(cc))
+    if store is not None:
+        store.record(enc_message, symbols, "caesar", 1, str(shift), cc[shift])
+    return shift
+
+
+def try_known_keywords(
+    enc_message: str | array,
+    size: int,
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set,
+    store: Result_Store,
+) -> tuple[str, float] | None:
+    """
+    Tries keywords already recovered for other messages as cheap candidates.
+    
+    Each stored keyword of the right length decrypts the first KNOWN_KEY_SAMPLE
+    characters. A keyword is accepted only when every column of the decrypted
+    sample correlates best with expected_dist at shift 0, i.e. each keyword
+    character already gives plaintext. Checking the sample as a whole would
+    accept a keyword that is only partly right.
+    
+    Args:
+        enc_message: Encrypted ciphertext, or its Utils.encode_indices() array
+        size: Assumed length of the Vigenere keyword
+        expected_dist: Dictionary of expected character frequencies for the language
+        symbols: Symbol_Set defining valid characters
+        store: Result_Store to take candidate keywords from
+    
+    Returns:
+        tuple[str, float] | None: (keyword, score of the decrypted sample), or None if no candidate fits
+    """
+    if isinstance(enc_message, array):
+        codes = enc_message[:KNOWN_KEY_SAMPLE]
+        if codes and max(codes) >= symbols.size:
+            return None  # sample has characters outside symbols; no keyword can apply
+        sample = "".join(map(symbols.__getitem__, codes))
+    else:
+        sample = enc_message[:KNOWN_KEY_SAMPLE]
+
+    expected = Frequency_Table.from_dict(expected_dist, symbols)
+    for keyword in store.known_keys(symbols, "vigenere", size):
+        try:
+            plain = vigenere_cipher(sample, keyword, False, symbols)
+        except ValueError:
+            return None  # sample has characters outside symbols; no keyword can apply
+        columns = Utils.column_views(plain, size, symbols)
+        total = sum(len(column) for column in columns) or 1
+        score = 0.0
+        for column in columns:
+            cc = Frequency_Table.from_text(column, symbols).normalize().cross_correlation(expected)
+            if cc[0] != max(cc):
+                break  # this keyword character is wrong
+            score += cc[0] * len(column) / total
+        else:
+            return keyword, score
+    return None
 
 
 def get_vigenere_keyword(
-    enc_message: str,
+    enc_message: str | array,
     size: int,
     expected_dist: dict[str, float],
     symbols: Symbol_Set = None,
+    store: Result_Store = None,
 ) -> str:
     """
     Gets the likely keyword used to originally encrypt a vigenere cipher.
     
+    With a store, a previously solved ciphertext is answered from the store,
+    and keywords recovered for other messages are tried first (see
+    try_known_keywords()) before falling back to full analysis.
+    
     Args:
-        enc_message: Encrypted ciphertext to analyze
+        enc_message: Encrypted ciphertext to analyze, or its Utils.encode_indices() array
+                     (encode once to try many key lengths without copying the text)
         size: Assumed length of the Vigenere keyword
         expected_dist: Dictionary of expected character frequencies for the language
         symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        store: Optional Result_Store checked before analysis and updated after it
     
     Returns:
         str: Most likely Vigenere keyword based on frequency analysis
@@ -126,14 +192,175 @@ def get_vigenere_keyword(
     keyword = ""
     if size == 0:
         return keyword
-    messages = Utils.columnize(enc_message, size)
-    for message in messages:
-        likely_shift = get_caesar_shift(message, expected_dist, symbols)
+    symbols = Utils.default_set(symbols)
+    if store is not None:
+        hit = store.lookup(enc_message, symbols, "vigenere", size)
+        if hit is None:
+            hit = try_known_keywords(enc_message, size, expected_dist, symbols, store)
+            if hit is not None:
+                store.record(enc_message, symbols, "vigenere", size, *hit)
+        if hit is not None:
+            return hit[0]
+
+    score = 0.0
+    expected = Frequency_Table.from_dict(expected_dist, symbols)
+    columns = Utils.column_views(enc_message, size, symbols)
+    total = sum(len(column) for column in columns) or 1
+    for column in columns:
+        cc = Frequency_Table.from_text(column, symbols).normalize().cross_correlation(expected)
+        likely_shift = cc.index(max(cc))
         likely_char = symbols.symbols()[likely_shift]
         keyword += likely_char
+        score += cc[likely_shift] * len(column) / total  # column's share of the decrypted text
+
+    if store is not None:
+        store.record(enc_message, symbols, "vigenere", size, keyword, score)
     return keyword
 
 
+def _adaptive_shift(
+    enc_message: str,
+    start: int,
+    period: int,
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set,
+    initial_sample: int,
+    confidence: float,
+    strided: bool,
+) -> tuple[int, int]:
+    """
+    Finds the Caesar shift of positions start, start + period, ... from a growing sample.
+    
+    The sample doubles until the relative gap between the best and second-best
+    cross_correlation scores, (best - second) / best, reaches confidence, or
+    until every position has been counted. Counts carry over between rounds, so
+    no character is counted twice.
+    
+    Args:
+        enc_message: Encrypted ciphertext
+        start: First position to analyze
+        period: Distance between analyzed positions (1 for Caesar, key length for a Vigenere column)
+        expected_dist: Dictionary of expected character frequencies for the language
+        symbols: Symbol_Set defining valid characters
+        initial_sample: Number of positions in the first sample
+        confidence: Relative gap needed to stop early
+        strided: Sample evenly spread positions (True) or a prefix (False)
+    
+    Returns:
+        tuple[int, int]: (most likely shift, number of positions counted)
+    """
+    available = len(range(start, len(enc_message), period))
+    expected = Frequency_Table.from_dict(expected_dist, symbols)
+    counts = Frequency_Table(symbols)
+    used = 0
+
+    def add(sample: str) -> tuple[int, bool]:
+        # merge the sample into the running counts, return (best shift, confident?)
+        nonlocal counts, used
+        counts = counts.merge(Frequency_Table.from_text(sample, symbols))
+        used += len(sample)
+        cc = counts.normalize().cross_correlation(expected)
+        ranked = sorted(cc, reverse=True) + [0.0]
+        best, second = ranked[0], ranked[1]
+        return cc.index(best), best > 0 and (best - second) / best >= confidence
+
+    if strided:
+        step = 1
+        while available >= step * 2 * initial_sample:
+            step *= 2
+        shift, done = add(enc_message[start::period * step])
+        while not done and step > 1:
+            # halving the stride adds the positions halfway between those already counted
+            step //= 2
+            shift, done = add(enc_message[start + period * step::period * 2 * step])
+    else:
+        taken, target = 0, initial_sample
+        while True:
+            shift, done = add(enc_message[start + period * taken:start + period * target:period])
+            taken = target
+            if done or taken >= available:
+                break
+            target *= 2
+    return shift, used
+
+
+def get_caesar_shift_adaptive(
+    enc_message: str,
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set = None,
+    *,
+    strided: bool = False,
+    initial_sample: int = ADAPTIVE_INITIAL_SAMPLE,
+    confidence: float = ADAPTIVE_CONFIDENCE,
+) -> tuple[int, int]:
+    """
+    Gets the likely Caesar shift from as little of the ciphertext as needed.
+    
+    Analyzes a sample that doubles in size until the best shift clearly beats
+    the second best (see ADAPTIVE_CONFIDENCE), so large ciphertexts are cracked
+    without counting every character.
+    
+    Args:
+        enc_message: Encrypted ciphertext to analyze
+        expected_dist: Dictionary of expected character frequencies for the language
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        strided: Sample evenly spread positions instead of a prefix
+        initial_sample: Number of characters in the first sample
+        confidence: Relative gap (best - second) / best between cross_correlation scores needed to stop
+    
+    Returns:
+        tuple[int, int]: (most likely shift, number of characters analyzed)
+    
+    Example:
+        >>> get_caesar_shift_adaptive(C, english_dist, UPPER_SPACE)
+        (7, 512)
+    """
+    symbols = Utils.default_set(symbols)
+    return _adaptive_shift(
+        enc_message, 0, 1, expected_dist, symbols, initial_sample, confidence, strided
+    )
+
+
+def get_vigenere_keyword_adaptive(
+    enc_message: str,
+    size: int,
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set = None,
+    *,
+    strided: bool = False,
+    initial_sample: int = ADAPTIVE_INITIAL_SAMPLE,
+    confidence: float = ADAPTIVE_CONFIDENCE,
+) -> tuple[str, int]:
+    """
+    Gets the likely Vigenere keyword, sampling each column only until it is clear.
+    
+    Every column is analyzed as in get_caesar_shift_adaptive(), using string
+    slices of only the sampled positions.
+    
+    Args:
+        enc_message: Encrypted ciphertext to analyze
+        size: Assumed length of the Vigenere keyword
+        expected_dist: Dictionary of expected character frequencies for the language
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        strided: Sample evenly spread positions instead of a prefix
+        initial_sample: Number of characters per column in the first sample
+        confidence: Relative gap (best - second) / best between cross_correlation scores needed to stop
+    
+    Returns:
+        tuple[str, int]: (most likely keyword, number of characters analyzed over all columns)
+    """
+    symbols = Utils.default_set(symbols)
+    keyword = ""
+    used = 0
+    for i in range(size):
+        shift, n = _adaptive_shift(
+            enc_message, i, size, expected_dist, symbols, initial_sample, confidence, strided
+        )
+        keyword += symbols[shift]
+        used += n
+    return keyword, used
+
+
 def main():
     common_symbol_sets = {
         "ASCII_printables": Symbol_Set((32, 126)),
@@ -245,8 +472,9 @@ def main():
     symbols = common_symbol_sets["upper_alphabet_with_space"] 
     for mj in [m1, m2, m3]:
         print(f"Original Message:\n{mj}")
+        encoded = Utils.encode_indices(mj, symbols)  # shared by every key length below
         for i in range(0, 9):
-            likely_keyword = get_vigenere_keyword(mj, i, english_dist, symbols)
+            likely_keyword = get_vigenere_keyword(encoded, i, english_dist, symbols)
             decrypted_message = vigenere_cipher(mj, likely_keyword, False, symbols)
             print(
                 f"keylength = {i}, tried keyword: '{likely_keyword}' -------------------------------------------"
@@ -0,0 +1,160 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import heapq
+from array import array
+from typing import Iterable, Iterator
+from ..ciph_utils import Utils, Symbol_Set, Frequency_Table
+
+_WORD = None  # trie key marking the end of a word
+
+
+def load_wordlist(path: str) -> Iterator[str]:
+    """
+    Stream candidate keywords from a file, one per line.
+
+    Args:
+        path: Wordlist file
+
+    Yields:
+        str: Each non-empty line, stripped of surrounding whitespace
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            word = line.strip()
+            if word:
+                yield word
+
+
+def column_scores(
+    enc_message: str | array,
+    size: int,
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set = None,
+) -> list[list[float]]:
+    """
+    Scores every possible keyword character in every column, without decrypting.
+
+    scores[i][k] is the cross_correlation of column i with expected_dist at
+    shift k, weighted by the column's share of the message. The score of a
+    whole keyword is then just the sum of one table entry per column, and
+    equals the correlation of the text it decrypts to with expected_dist.
+
+    Args:
+        enc_message: Encrypted ciphertext, or its Utils.encode_indices() array
+        size: Keyword length
+        expected_dist: Dictionary of expected character frequencies for the language
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+
+    Returns:
+        list[list[float]]: size rows of symbols.size scores
+    """
+    symbols = Utils.default_set(symbols)
+    columns = Utils.column_views(enc_message, size, symbols)
+    total = sum(len(column) for column in columns) or 1
+    expected = Frequency_Table.from_dict(expected_dist, symbols)
+    scores = []
+    for column in columns:
+        cc = Frequency_Table.from_text(column, symbols).normalize().cross_correlation(expected)
+        weight = len(column) / total
+        scores.append([x * weight for x in cc])
+    return scores
+
+
+def _build_trie(words: Iterable[tuple[str, list[int]]]) -> dict:
+    """
+    Builds a trie of keyword shifts, so keywords sharing a prefix share its score.
+
+    Args:
+        words: (keyword, symbol indices of its characters) pairs
+
+    Returns:
+        dict: Nested {shift: child} dictionaries; a finished keyword is stored under _WORD
+    """
+    root = {}
+    for word, shifts in words:
+        node = root
+        for k in shifts:
+            node = node.setdefault(k, {})
+        node[_WORD] = word
+    return root
+
+
+def _search(trie: dict, scores: list[list[float]], top_k: int, best: list) -> None:
+    """
+    Depth-first search of the trie, keeping the top_k keywords in the min-heap best.
+
+    A branch is pruned when its score so far plus the best possible score of
+    the remaining columns cannot beat the current k-th best keyword.
+
+    Args:
+        trie: Output of _build_trie() for keywords of len(scores)
+        scores: Output of column_scores()
+        top_k: Number of keywords to keep
+        best: Heap of (score, keyword) pairs, updated in place
+    """
+    # remaining[i] = highest possible score of columns i, i + 1, ...
+    remaining = [0.0] * (len(scores) + 1)
+    for i in range(len(scores) - 1, -1, -1):
+        remaining[i] = remaining[i + 1] + max(scores[i])
+
+    stack = [(trie, 0, 0.0)]
+    while stack:
+        node, depth, score = stack.pop()
+        if len(best) == top_k and score + remaining[depth] <= best[0][0]:
+            continue
+        for k, child in node.items():
+            if k is _WORD:
+                if len(best) < top_k:
+                    heapq.heappush(best, (score, child))
+                elif score > best[0][0]:
+                    heapq.heapreplace(best, (score, child))
+            else:
+                stack.append((child, depth + 1, score + scores[depth][k]))
+
+
+def dictionary_attack(
+    enc_message: str,
+    words: Iterable[str],
+    expected_dist: dict[str, float],
+    symbols: Symbol_Set = None,
+    top_k: int = 10,
+) -> list[tuple[str, float]]:
+    """
+    Ranks candidate Vigenere keywords from a wordlist without decrypting with any of them.
+
+    Candidates are grouped by length. For each length the ciphertext's column
+    scores are computed once (column_scores()), and the candidates are walked
+    through a trie so shared prefixes are scored once and hopeless prefixes are
+    pruned.
+
+    Args:
+        enc_message: Encrypted ciphertext to analyze
+        words: Candidate keywords, e.g. from load_wordlist(). Words with characters outside symbols are skipped.
+        expected_dist: Dictionary of expected character frequencies for the language
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        top_k: Number of keywords to return
+
+    Returns:
+        list[tuple[str, float]]: (keyword, score) pairs, best first
+
+    Example:
+        >>> C = vigenere_cipher(message, "LEMON", True, UPPER_SPACE)
+        >>> dictionary_attack(C, ["APPLE", "LEMON", "MELON"], english_dist, UPPER_SPACE, top_k=1)
+        [('LEMON', 0.0766...)]
+    """
+    symbols = Utils.default_set(symbols)
+    table = symbols.index_table()
+    encoded = Utils.encode_indices(enc_message, symbols)
+
+    by_length = {}
+    for word in words:
+        if 0 < len(word) <= len(encoded) and all(c in table for c in word):
+            by_length.setdefault(len(word), []).append((word, [table[c] for c in word]))
+
+    best = []
+    for size, group in by_length.items():
+        scores = column_scores(encoded, size, expected_dist, symbols)
+        _search(_build_trie(group), scores, top_k, best)
+    return [(word, score) for score, word in sorted(best, reverse=True)]
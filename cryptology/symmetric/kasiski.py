@@ -0,0 +1,107 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+from ..ciph_utils import Utils, Symbol_Set
+
+MAX_KEY_LENGTH = 20  # longest key length candidate_key_lengths() considers
+
+
+def repeat_distances(text: str, min_length: int = 3, symbols: Symbol_Set = None) -> list[int]:
+    """
+    Finds repeated substrings of at least min_length characters and returns the distances between them.
+
+    The text is indexed in a single linear pass: a rolling code of the last
+    min_length symbols (base symbols.size, so distinct substrings never collide)
+    is looked up in a dictionary of where it was last seen. A longer repeat is
+    counted once, not once per min_length window inside it.
+
+    Args:
+        text: Ciphertext to index
+        min_length: Shortest repeat to consider
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+
+    Returns:
+        list[int]: Distance from each repeat to the previous occurrence of the same substring
+
+    Raises:
+        ValueError: If min_length is not positive
+
+    Example:
+        >>> repeat_distances("ABCXXABCYYABC", 3, Symbol_Set("ABCXY"))
+        [5, 5]
+    """
+    if min_length <= 0:
+        raise ValueError("min_length must be a positive integer.")
+    symbols = Utils.default_set(symbols)
+    idx = Utils.ord_array(text, symbols, start_index=0)
+    size = symbols.size
+    high = size ** (min_length - 1)
+
+    last = {}
+    distances = []
+    code = 0
+    run = None  # distance of the repeat that ended one position earlier, if any
+    for i, x in enumerate(idx):
+        code = (code % high) * size + x  # drop the oldest symbol, append the newest
+        start = i - min_length + 1
+        if start < 0:
+            continue
+        prev = last.get(code)
+        distance = None if prev is None else start - prev
+        if distance is not None and distance != run:
+            distances.append(distance)
+        run = distance
+        last[code] = start
+    return distances
+
+
+def candidate_key_lengths(
+    text: str,
+    symbols: Symbol_Set = None,
+    *,
+    min_length: int = 3,
+    max_key_length: int = MAX_KEY_LENGTH,
+    top: int = 5,
+) -> list[tuple[int, float]]:
+    """
+    Ranks likely Vigenere key lengths by Kasiski examination.
+
+    Repeats in a Vigenere ciphertext mostly come from repeated plaintext lined
+    up with the same part of the keyword, so their distances are multiples of
+    the key length. Each length f from 2 to max_key_length is scored by the
+    share of distances divisible by f minus 1/f, the share expected by chance.
+    This favours the key length over both its divisors and its multiples.
+
+    Args:
+        text: Ciphertext to analyze
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        min_length: Shortest repeat to consider
+        max_key_length: Longest key length to consider
+        top: Number of candidates to return
+
+    Returns:
+        list[tuple[int, float]]: (key length, score) pairs, best first. Empty if the text has no repeats.
+
+    Example:
+        >>> candidate_key_lengths(m1, UPPER_SPACE, top=3)  # m1 from cryptanalysis.main()
+        [(5, 0.738...), (10, 0.369...), (15, 0.219...)]
+    """
+    distances = repeat_distances(text, min_length, symbols)
+    if not distances:
+        return []
+
+    # tally each distinct distance once, then spread the tallies over the lengths dividing it
+    tally = {}
+    for d in distances:
+        tally[d] = tally.get(d, 0) + 1
+    votes = [0] * (max_key_length + 1)
+    for d, k in tally.items():
+        for f in range(2, max_key_length + 1):
+            if d % f == 0:
+                votes[f] += k
+
+    total = len(distances)
+    scores = [(f, votes[f] / total - 1 / f) for f in range(2, max_key_length + 1)]
+    scores.sort(key=lambda pair: pair[1], reverse=True)
+    return scores[:top]
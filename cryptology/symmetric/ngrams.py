@@ -0,0 +1,140 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+from operator import add, mul
+from ..ciph_utils import Utils, Symbol_Set
+
+MAX_NGRAM_TABLE = 1 << 24  # largest dense table (symbols.size ** n entries) count_ngrams() will build
+
+
+def ngram_codes(text: str, n: int, symbols: Symbol_Set = None) -> array:
+    """
+    Encode every n-gram of text as one integer in base symbols.size.
+
+    The n-gram starting at position i becomes
+    idx[i] * size^(n-1) + idx[i+1] * size^(n-2) + ... + idx[i+n-1],
+    computed a whole array at a time rather than character by character.
+    Characters outside symbols keep their position, as in
+    Utils.encode_indices(), and every n-gram containing one gets the
+    out-of-table code size^n instead. So no n-gram spans a dropped character,
+    and position i still belongs to Vigenere column i % key_length.
+
+    Args:
+        text: Text to encode
+        n: n-gram length (1 for unigrams, 2 for bigrams, ...)
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+
+    Returns:
+        array: One code per n-gram position (len(text) - n + 1 codes), size^n where
+        the n-gram has a character outside symbols
+
+    Raises:
+        ValueError: If n is not positive
+
+    Example:
+        >>> list(ngram_codes("ABCA", 2, Symbol_Set("ABC")))  # AB, BC, CA
+        [1, 5, 6]
+        >>> list(ngram_codes("AB,A", 2, Symbol_Set("ABC")))  # AB, then two n-grams with ','
+        [1, 9, 9]
+    """
+    if n <= 0:
+        raise ValueError("n must be a positive integer.")
+    symbols = Utils.default_set(symbols)
+    size = symbols.size
+    idx = Utils.encode_indices(text, symbols)  # out-of-set characters become the sentinel size
+    m = max(0, len(idx) - n + 1)
+
+    codes = array("Q", idx[:m])
+    for k in range(1, n):
+        codes = array("Q", map(add, map(mul, codes, repeat(size)), idx[k:k + m]))
+
+    invalid = size ** n
+    for pos in compress(range(len(idx)), map(size.__eq__, idx)):
+        for i in range(max(0, pos - n + 1), min(pos + 1, m)):
+            codes[i] = invalid
+    return codes
+
+
+def _bincount(codes, length: int) -> array:
+    """
+    Count how often each code in range(length) occurs, as a dense array.
+    Codes outside the range (n-grams with out-of-set characters) are skipped.
+    """
+    counts = array("Q", bytes(8 * length))
+    for code, k in Counter(codes).items():
+        if code < length:
+            counts[code] = k
+    return counts
+
+
+def count_ngrams(
+    text: str, n: int, symbols: Symbol_Set = None, *, key_length: int | None = None
+) -> array | list[array]:
+    """
+    Count every n-gram of text in a dense table indexed by ngram_codes() code.
+
+    Args:
+        text: Text to analyze
+        n: n-gram length (1 for unigrams, 2 for bigrams, ...)
+        symbols: Symbol_Set defining valid characters (defaults to printable ASCII)
+        key_length: If given, count separately for each Vigenere column: table i
+                    holds the n-grams starting at positions i, i + key_length, ...
+                    of the original text, as in Utils.column_views()
+
+    Returns:
+        array | list[array]: symbols.size ** n counts, or one such table per column
+
+    Raises:
+        ValueError: If n or key_length is not positive, or the table would exceed MAX_NGRAM_TABLE entries
+
+    Example:
+        >>> counts = count_ngrams("ABAB", 2, Symbol_Set("AB"))
+        >>> list(counts)  # AA, AB, BA, BB
+        [0, 2, 1, 0]
+    """
+    symbols = Utils.default_set(symbols)
+    length = symbols.size ** max(n, 1)
+    if length > MAX_NGRAM_TABLE:
+        raise ValueError(
+            f"A table of {symbols.size}^{n} = {length} entries is larger than MAX_NGRAM_TABLE."
+        )
+    codes = ngram_codes(text, n, symbols)
+    if key_length is None:
+        return _bincount(codes, length)
+    if key_length <= 0:
+        raise ValueError("key_length must be a positive integer.")
+    return [_bincount(codes[col::key_length], length) for col in range(key_length)]
+
+
+def ngram_dict(counts: array, n: int, symbols: Symbol_Set = None) -> dict[str, int]:
+    """
+    Convert a count_ngrams() table to a {n-gram: count} dictionary of the n-grams that occur.
+
+    Args:
+        counts: Table from count_ngrams()
+        n: n-gram length the table was built with
+        symbols: Symbol_Set the table was built with (defaults to printable ASCII)
+
+    Returns:
+        dict[str, int]: Counts of the n-grams present, most frequent first
+
+    Example:
+        >>> ngram_dict(count_ngrams("ABAB", 2, Symbol_Set("AB")), 2, Symbol_Set("AB"))
+        {'AB': 2, 'BA': 1}
+    """
+    symbols = Utils.default_set(symbols)
+    size = symbols.size
+    result = {}
+    present = [code for code, k in enumerate(counts) if k]
+    for code in sorted(present, key=counts.__getitem__, reverse=True):
+        chars = []
+        rest = code
+        for _ in range(n):
+            rest, i = divmod(rest, size)
+            chars.append(symbols[i])
+        result["".join(reversed(chars))] = counts[code]
+    return result
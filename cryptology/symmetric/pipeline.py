@@ -0,0 +1,176 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import math
+from ..ciph_utils import Utils, Symbol_Set
+from .caesar_cipher import caesar_cipher
+from .vigenere_cipher import vigenere_cipher
+
+
+class Cipher_Pipeline:
+    """
+    Chains shift-based ciphers (Caesar and Vigenere) over one Symbol_Set and
+    runs them as a single pass.
+
+    Every stage adds a shift to each character that depends only on its
+    position, so the whole chain collapses into one per-position shift
+    schedule. Its period is the LCM of the keyword lengths of the stages.
+
+    Stages are added with caesar() and vigenere(), which return the pipeline
+    so calls can be chained:
+
+    - Cipher_Pipeline(UPPER_SPACE).caesar(3, True).vigenere("KEY", True)
+
+    Attributes:
+        symbols (Symbol_Set): Symbol set shared by every stage
+        stages (list[tuple[str, int | str, bool]]): (kind, key, encrypt) for each stage, in order
+    """
+
+    def __init__(self, symbols: Symbol_Set = None):
+        """
+        Initialize an empty pipeline.
+
+        Args:
+            symbols: Symbol_Set used by every stage (defaults to printable ASCII)
+        """
+        self.symbols = Utils.default_set(symbols)
+        self.stages = []
+        self._schedule = None
+
+    def caesar(self, shift: int, encrypt: bool) -> "Cipher_Pipeline":
+        """
+        Append a caesar_cipher stage.
+
+        Args:
+            shift: Caesar shift
+            encrypt: Whether the stage encrypts (True) or decrypts (False)
+
+        Returns:
+            Cipher_Pipeline: This pipeline, for chaining
+        """
+        self.stages.append(("caesar", shift, encrypt))
+        self._schedule = None
+        return self
+
+    def vigenere(self, keyword: str, encrypt: bool) -> "Cipher_Pipeline":
+        """
+        Append a vigenere_cipher stage.
+
+        Args:
+            keyword: Vigenere keyword, made of characters in the pipeline's Symbol_Set
+            encrypt: Whether the stage encrypts (True) or decrypts (False)
+
+        Returns:
+            Cipher_Pipeline: This pipeline, for chaining
+
+        Raises:
+            ValueError: If the keyword has a character outside the Symbol_Set
+        """
+        for k in keyword:
+            self.symbols.index(k)  # validate now rather than at run()
+        self.stages.append(("vigenere", keyword, encrypt))
+        self._schedule = None
+        return self
+
+    def schedule(self) -> list[int]:
+        """
+        Combined shift applied at each position, repeating with the schedule's length.
+
+        Returns:
+            list[int]: Shifts (mod symbols.size) for positions 0 to period - 1
+
+        Example:
+            >>> Cipher_Pipeline(Symbol_Set("ABCD")).caesar(1, True).vigenere("AB", True).schedule()
+            [1, 2]
+        """
+        if self._schedule is not None:
+            return self._schedule
+
+        period = 1
+        for kind, key, _ in self.stages:
+            if kind == "vigenere" and key:
+                period = math.lcm(period, len(key))
+
+        schedule = [0] * period
+        for kind, key, encrypt in self.stages:
+            direction = 1 if encrypt else -1
+            if kind == "caesar":
+                for i in range(period):
+                    schedule[i] += key * direction
+            elif key:
+                key_shifts = [self.symbols.index(k) for k in key]
+                for i in range(period):
+                    schedule[i] += key_shifts[i % len(key_shifts)] * direction
+
+        self._schedule = [s % self.symbols.size for s in schedule]
+        return self._schedule
+
+    def run(self, message: str) -> str:
+        """
+        Apply every stage to message in one pass.
+
+        The result is identical to calling caesar_cipher and vigenere_cipher
+        one after another. That includes their handling of characters outside
+        the Symbol_Set: a leading Caesar stage drops them, while a leading
+        Vigenere stage raises ValueError.
+
+        Args:
+            message: Plaintext or ciphertext to process
+
+        Returns:
+            str: Output of the last stage
+
+        Raises:
+            ValueError: If the first stage is Vigenere and message has a character outside the Symbol_Set
+
+        Example:
+            >>> p = Cipher_Pipeline(UPPER_SPACE).caesar(3, True).vigenere("KEY", True)
+            >>> p.run("HELLO WORLD") == vigenere_cipher(caesar_cipher("HELLO WORLD", 3, True, UPPER_SPACE), "KEY", True, UPPER_SPACE)
+            True
+        """
+        active = [s for s in self.stages if s[0] == "caesar" or s[1]]
+        if not active or not message:
+            return message
+
+        symbols = self.symbols
+        table = {c: i for i, c in reversed(list(enumerate(symbols.symbols())))}
+        if active[0][0] == "caesar":
+            message = "".join(c for c in message if c in table)
+        else:
+            for c in message:
+                if c not in table:
+                    symbols.index(c)  # raises the same ValueError vigenere_cipher would
+
+        schedule = self.schedule()
+        period = len(schedule)
+        chars = symbols.symbols()
+        n = symbols.size
+        return "".join(
+            chars[(table[c] + schedule[i % period]) % n] for i, c in enumerate(message)
+        )
+
+
+def main():
+    symbols = Symbol_Set("ABCDEFGHIJKLMNOPQRSTUVWXYZ ")
+    message = "HELLO WORLD THIS MESSAGE GOES THROUGH SEVERAL CIPHERS"
+    pipeline = (
+        Cipher_Pipeline(symbols)
+        .caesar(7, True)
+        .vigenere("KEY", True)
+        .vigenere("LEMON", True)
+    )
+    C = pipeline.run(message)
+    staged = vigenere_cipher(
+        vigenere_cipher(caesar_cipher(message, 7, True, symbols), "KEY", True, symbols),
+        "LEMON", True, symbols,
+    )
+    print("Cipher Pipeline --------------------------------")
+    print(f"Message: {message}")
+    print(f"Shift schedule (period {len(pipeline.schedule())}): {pipeline.schedule()}")
+    print(f"Ciphertext: {C}")
+    print(f"Matches stage-by-stage output: {C == staged}")
+
+
+if __name__ == "__main__":
+    main()
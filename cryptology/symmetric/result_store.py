@@ -0,0 +1,222 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import hashlib
+import sqlite3
+from array import array
+from typing import Iterable
+from ..ciph_utils import Utils, Symbol_Set, Column_View
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT NOT NULL,
+    symbol_set  TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    key         TEXT NOT NULL,
+    score       REAL NOT NULL,
+    PRIMARY KEY (fingerprint, symbol_set, kind, size)
+);
+CREATE INDEX IF NOT EXISTS results_by_key ON results (symbol_set, kind, size, key);
+"""
+
+_LOOKUP_BATCH = 500  # fingerprints per SELECT ... IN (...) in lookup_many()
+
+
+def fingerprint(enc_message: str | array | Column_View, symbols: Symbol_Set = None) -> str:
+    """
+    Fingerprint a ciphertext by hashing its symbol-index encoding.
+
+    A string, its Utils.encode_indices() array and an equivalent Column_View
+    all hash the same way, so results are found whichever form is analyzed.
+
+    Args:
+        enc_message: Ciphertext as a string, encoded array, or Column_View
+        symbols: Symbol_Set used to encode strings (defaults to printable ASCII)
+
+    Returns:
+        str: Hex SHA-256 digest
+
+    Example:
+        >>> fingerprint("ABC", UPPER) == fingerprint(Utils.encode_indices("ABC", UPPER), UPPER)
+        True
+    """
+    symbols = Utils.default_set(symbols)
+    if isinstance(enc_message, str):
+        enc_message = Utils.encode_indices(enc_message, symbols)
+    if isinstance(enc_message, Column_View):
+        enc_message = array(enc_message.codes.format, enc_message.codes)
+    return hashlib.sha256(enc_message.tobytes()).hexdigest()
+
+
+def _symbol_set_key(symbols: Symbol_Set) -> str:
+    """
+    Describe a Symbol_Set as a string, so equal sets share results.
+
+    Args:
+        symbols: Symbol_Set to describe
+
+    Returns:
+        str: 'range:low-high' or 'set:' followed by the characters
+    """
+    if symbols.is_range:
+        return f"range:{symbols.low}-{symbols.high}"
+    return "set:" + "".join(symbols.allowed)
+
+
+class Result_Store:
+    """
+    A local SQLite store of solved ciphertexts and the keys recovered for them.
+
+    Results are indexed by ciphertext fingerprint, Symbol_Set, cipher kind
+    ('caesar' or 'vigenere') and key size. Pass a store to get_caesar_shift() or
+    get_vigenere_keyword() and it is checked before any analysis runs, and
+    updated afterwards. Stored results assume one language model
+    (expected_dist) per store.
+
+    Attributes:
+        path (str): Database file, or ':memory:' for a throwaway store
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open (creating if needed) a result store.
+
+        Args:
+            path: SQLite database file, or ':memory:' (default)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Commit pending results and close the database.
+        """
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "Result_Store":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def lookup(
+        self, enc_message: str | array | Column_View, symbols: Symbol_Set, kind: str, size: int
+    ) -> tuple[str, float] | None:
+        """
+        Find the stored key for a ciphertext.
+
+        Args:
+            enc_message: Ciphertext as a string, encoded array, or Column_View
+            symbols: Symbol_Set the ciphertext uses
+            kind: 'caesar' or 'vigenere'
+            size: Key size (1 for Caesar, keyword length for Vigenere)
+
+        Returns:
+            tuple[str, float] | None: (key, score), or None if it has not been solved
+        """
+        row = self._conn.execute(
+            "SELECT key, score FROM results"
+            " WHERE fingerprint = ? AND symbol_set = ? AND kind = ? AND size = ?",
+            (fingerprint(enc_message, symbols), _symbol_set_key(symbols), kind, size),
+        ).fetchone()
+        return row
+
+    def lookup_many(
+        self, enc_messages: Iterable[str | array | Column_View], symbols: Symbol_Set, kind: str, size: int
+    ) -> list[tuple[str, float] | None]:
+        """
+        Bulk version of lookup().
+
+        Args:
+            enc_messages: Ciphertexts to look up
+            symbols: Symbol_Set the ciphertexts use
+            kind: 'caesar' or 'vigenere'
+            size: Key size (1 for Caesar, keyword length for Vigenere)
+
+        Returns:
+            list[tuple[str, float] | None]: One result per ciphertext, in input order
+        """
+        prints = [fingerprint(m, symbols) for m in enc_messages]
+        found = {}
+        for i in range(0, len(prints), _LOOKUP_BATCH):
+            batch = prints[i:i + _LOOKUP_BATCH]
+            rows = self._conn.execute(
+                "SELECT fingerprint, key, score FROM results"
+                " WHERE symbol_set = ? AND kind = ? AND size = ?"
+                f" AND fingerprint IN ({', '.join('?' * len(batch))})",
+                (_symbol_set_key(symbols), kind, size, *batch),
+            )
+            found.update((fp, (key, score)) for fp, key, score in rows)
+        return [found.get(fp) for fp in prints]
+
+    def record(
+        self,
+        enc_message: str | array | Column_View,
+        symbols: Symbol_Set,
+        kind: str,
+        size: int,
+        key: str,
+        score: float,
+    ) -> None:
+        """
+        Store (or replace) the key recovered for a ciphertext.
+
+        Args:
+            enc_message: Ciphertext as a string, encoded array, or Column_View
+            symbols: Symbol_Set the ciphertext uses
+            kind: 'caesar' or 'vigenere'
+            size: Key size (1 for Caesar, keyword length for Vigenere)
+            key: Recovered key (a Caesar shift is stored as its decimal string)
+            score: Correlation of the decrypted text with the expected distribution
+        """
+        self.record_many([(enc_message, symbols, kind, size, key, score)])
+
+    def record_many(
+        self, rows: Iterable[tuple[str | array | Column_View, Symbol_Set, str, int, str, float]]
+    ) -> None:
+        """
+        Store many results in a single transaction.
+
+        Args:
+            rows: (enc_message, symbols, kind, size, key, score) tuples, as passed to record()
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (fingerprint(m, s), _symbol_set_key(s), kind, size, key, score)
+                    for m, s, kind, size, key, score in rows
+                ),
+            )
+
+    def known_keys(self, symbols: Symbol_Set, kind: str, size: int, limit: int = 20) -> list[str]:
+        """
+        Keys already recovered for this Symbol_Set, most frequently seen first.
+
+        Useful as cheap candidates to try on new ciphertexts before full analysis.
+
+        Args:
+            symbols: Symbol_Set the keys belong to
+            kind: 'caesar' or 'vigenere'
+            size: Key size (1 for Caesar, keyword length for Vigenere)
+            limit: Maximum number of keys to return
+
+        Returns:
+            list[str]: Distinct keys
+        """
+        rows = self._conn.execute(
+            "SELECT key FROM results WHERE symbol_set = ? AND kind = ? AND size = ?"
+            " GROUP BY key ORDER BY COUNT(*) DESC, MAX(score) DESC LIMIT ?",
+            (_symbol_set_key(symbols), kind, size, limit),
+        )
+        return [key for (key,) in rows]
+
+    def __len__(self) -> int:
+        """
+        Return the number of stored results.
+        """
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
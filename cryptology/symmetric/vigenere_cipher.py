@@ -2,9 +2,13 @@
 # CSC-348 Computer Security
 # 1/24/26
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from ..ciph_utils import Symbol_Set, Utils
 from .caesar_cipher import caesar_cipher
 
+MIN_PARALLEL_CHUNK = 1 << 16  # messages shorter than two chunks are processed sequentially
+
 
 def vigenere_cipher(
     message: str, keyword: str, encrypt: bool, symbols: Symbol_Set = None
@@ -44,6 +48,69 @@ def vigenere_cipher(
         result.append(symbols[message_index + shift])
     return "".join(result)
 
+
+def _vigenere_chunk(args: tuple[str, str, bool, Symbol_Set]) -> str:
+    """
+    Worker for vigenere_cipher_parallel(); unpacks one chunk's arguments.
+    """
+    return vigenere_cipher(*args)
+
+
+def vigenere_cipher_parallel(
+    message: str,
+    keyword: str,
+    encrypt: bool,
+    symbols: Symbol_Set = None,
+    *,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    use_processes: bool = True,
+) -> str:
+    """
+    Same result as vigenere_cipher(), computed on several cores for large messages.
+    
+    The shift at position i only depends on i % len(keyword), so the message is
+    split into chunks and each chunk is processed with the keyword rotated to
+    the phase of its starting offset. Chunks are joined back in order.
+    
+    Args:
+        message: The plaintext (when encrypting) or ciphertext (when decrypting) to process
+        keyword: The keyword used to determine shift values for each character position
+        encrypt: Boolean flag indicating whether to encrypt (True) or decrypt (False) the message
+        symbols: Symbol_Set defining the valid character range. If None, uses default printable ASCII (32-126)
+        workers: Number of workers (defaults to the number of cores)
+        chunk_size: Characters per chunk (defaults to an even split between workers,
+                    at least MIN_PARALLEL_CHUNK)
+        use_processes: Use a process pool (True) or a thread pool (False)
+    
+    Returns:
+        str: The resulting ciphertext (if encrypting) or plaintext (if decrypting)
+    
+    Raises:
+        ValueError: If a character of message or keyword is not in the symbol set
+    
+    Example:
+        >>> vigenere_cipher_parallel("HELLO" * 100000, "KEY", True) == vigenere_cipher("HELLO" * 100000, "KEY", True)
+        True
+    """
+    if not keyword or not message:
+        return message
+    symbols = Utils.default_set(symbols)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_PARALLEL_CHUNK, -(-len(message) // workers))
+    if workers == 1 or len(message) <= chunk_size:
+        return vigenere_cipher(message, keyword, encrypt, symbols)
+
+    jobs = []
+    for start in range(0, len(message), chunk_size):
+        phase = start % len(keyword)
+        jobs.append((message[start:start + chunk_size], keyword[phase:] + keyword[:phase], encrypt, symbols))
+
+    pool_type = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_type(max_workers=workers) as pool:
+        return "".join(pool.map(_vigenere_chunk, jobs))
+
 def main():
     # 1.2
     keyword = "DeLaRiva"
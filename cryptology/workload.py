@@ -0,0 +1,364 @@
+# Logan Jacobs
+# CSC-348 Computer Security
+# 10/19/26
+
+import itertools
+import json
+import math
+import os
+import random
+import tempfile
+from typing import Iterator, Optional
+from .ciph_utils import Utils, Symbol_Set, Frequency_Table, UPPER_SPACE
+from .symmetric.caesar_cipher import caesar_cipher
+from .symmetric.vigenere_cipher import vigenere_cipher
+from .asymmetric.rsa import find_n, find_totient, find_d, encrypt
+from .asymmetric.factor import prime_sieve
+from .asymmetric.hybrid import KEY_START_INDEX
+
+CIPHERS = ("caesar", "vigenere", "rsa")
+DEFAULT_SEED = 348
+RECORD_LENGTH = 1 << 12         # plaintext characters per record
+MAX_KEYWORD_LENGTH = 20         # longest random Vigenere keyword
+RSA_PRIME_LIMIT = 1 << 16       # random RSA primes are drawn from below this
+WRITE_BUFFER = 1 << 20          # bytes buffered per corpus file
+
+PLAINTEXTS = "plaintexts.txt"
+CIPHERTEXTS = "ciphertexts.txt"
+TRUTH = "truth.jsonl"
+
+
+def record_rng(seed: int, index: int) -> random.Random:
+    """
+    Random number generator for one record.
+
+    Every record gets its own generator, seeded from (seed, index), so any
+    record can be regenerated on its own and a corpus does not change when
+    records are added after it.
+
+    Args:
+        seed: Corpus seed
+        index: Record number
+
+    Returns:
+        random.Random: Seeded generator
+    """
+    return random.Random(f"{seed}:{index}")
+
+
+def _cumulative_weights(dist: Optional[dict[str, float]], symbols: Symbol_Set) -> list[float]:
+    """
+    Cumulative weights of every symbol, for random.choices(). Symbols missing from dist get weight 0.
+
+    Raises:
+        ValueError: If dist has a negative weight or no positive weight for any symbol
+    """
+    if dist is None:
+        return list(range(1, symbols.size + 1))
+    weights = Frequency_Table.from_dict(dist, symbols).values
+    if min(weights) < 0 or not sum(weights) > 0:
+        raise ValueError("Distribution must have non-negative weights and at least one positive weight.")
+    return list(itertools.accumulate(weights))
+
+
+def random_plaintext(
+    rng: random.Random,
+    length: int,
+    symbols: Symbol_Set = None,
+    dist: Optional[dict[str, float]] = None,
+    cum_weights: Optional[list[float]] = None,
+) -> str:
+    """
+    Draw a plaintext whose characters are independent samples from dist.
+
+    Args:
+        rng: Random number generator
+        length: Number of characters
+        symbols: Symbol_Set to draw from (defaults to printable ASCII)
+        dist: Character frequencies, e.g. {'A': 0.082, ...}. Defaults to uniform over symbols.
+        cum_weights: Precomputed cumulative weights, to skip rebuilding them from dist on every call
+
+    Returns:
+        str: The plaintext
+
+    Example:
+        >>> random_plaintext(random.Random(1), 8, UPPER_SPACE, {"A": 1, "B": 1})
+        'ABBAAABB'
+    """
+    symbols = Utils.default_set(symbols)
+    if cum_weights is None:
+        cum_weights = _cumulative_weights(dist, symbols)
+    return "".join(rng.choices(symbols.symbols(), cum_weights=cum_weights, k=length))
+
+
+def random_caesar_shift(rng: random.Random, symbols: Symbol_Set = None) -> int:
+    """
+    Draw a Caesar shift that changes the message (1 to symbols.size - 1).
+
+    Args:
+        rng: Random number generator
+        symbols: Symbol_Set of the message (defaults to printable ASCII)
+
+    Returns:
+        int: The shift
+    """
+    symbols = Utils.default_set(symbols)
+    return rng.randrange(1, symbols.size) if symbols.size > 1 else 0
+
+
+def random_keyword(
+    rng: random.Random, symbols: Symbol_Set = None, max_length: int = MAX_KEYWORD_LENGTH
+) -> str:
+    """
+    Draw a Vigenere keyword of random length (1 to max_length) and random characters.
+
+    Args:
+        rng: Random number generator
+        symbols: Symbol_Set of the message (defaults to printable ASCII)
+        max_length: Longest keyword to draw
+
+    Returns:
+        str: The keyword
+
+    Raises:
+        ValueError: If max_length is not positive
+    """
+    if max_length <= 0:
+        raise ValueError("max_length must be a positive integer.")
+    symbols = Utils.default_set(symbols)
+    chars = symbols.symbols()
+    return "".join(rng.choice(chars) for _ in range(rng.randint(1, max_length)))
+
+
+def random_rsa_key(
+    rng: random.Random, symbols: Symbol_Set = None, prime_limit: int = RSA_PRIME_LIMIT
+) -> dict[str, int]:
+    """
+    Draw a small RSA key pair that can encrypt every symbol of symbols.
+
+    p and q are distinct primes from prime_sieve(prime_limit), chosen so that
+    n is at least symbols.size + KEY_START_INDEX. e is a random exponent
+    coprime to φ(n) and d is its inverse from find_d().
+
+    Args:
+        rng: Random number generator
+        symbols: Symbol_Set of the message (defaults to printable ASCII)
+        prime_limit: Largest prime to draw
+
+    Returns:
+        dict[str, int]: {'p', 'q', 'n', 'e', 'd'}
+
+    Raises:
+        ValueError: If no two primes below prime_limit give a large enough n
+    """
+    symbols = Utils.default_set(symbols)
+    primes = prime_sieve(prime_limit)
+    least = symbols.size + KEY_START_INDEX
+    if len(primes) < 2 or primes[-1] * primes[-2] < least:
+        raise ValueError(f"prime_limit = {prime_limit} is too small for n >= {least}.")
+
+    while True:
+        p, q = rng.sample(primes, 2)
+        if p * q >= least:
+            break
+    n = find_n(p, q)
+    phi_n = find_totient(p, q)
+    while True:
+        e = rng.randrange(3, phi_n)
+        if math.gcd(e, phi_n) == 1:
+            break
+    return {"p": p, "q": q, "n": n, "e": e, "d": find_d(e, phi_n)}
+
+
+def generate_record(
+    seed: int,
+    index: int,
+    length: int,
+    cipher: Optional[str] = None,
+    symbols: Symbol_Set = None,
+    dist: Optional[dict[str, float]] = None,
+    cum_weights: Optional[list[float]] = None,
+) -> tuple[str, str, dict]:
+    """
+    Generate one (plaintext, ciphertext, ground truth) record.
+
+    RSA ciphertexts encrypt each symbol index on its own (offset by
+    KEY_START_INDEX, since 0 and 1 are unchanged by RSA) and are written as
+    space-separated integers.
+
+    Args:
+        seed: Corpus seed
+        index: Record number
+        length: Plaintext length
+        cipher: One of CIPHERS, or None to pick one at random per record
+        symbols: Symbol_Set of the plaintext (defaults to printable ASCII)
+        dist: Character frequencies of the plaintext (defaults to uniform)
+        cum_weights: Precomputed cumulative weights of dist
+
+    Returns:
+        tuple[str, str, dict]: (plaintext, ciphertext, ground truth). The ground truth holds
+        the record's index, cipher, length and key.
+
+    Raises:
+        ValueError: If cipher is not one of CIPHERS
+    """
+    symbols = Utils.default_set(symbols)
+    rng = record_rng(seed, index)
+    if cipher is None:
+        cipher = rng.choice(CIPHERS)
+    elif cipher not in CIPHERS:
+        raise ValueError(f"Unknown cipher '{cipher}'; expected one of {CIPHERS}.")
+
+    plaintext = random_plaintext(rng, length, symbols, dist, cum_weights)
+    if cipher == "caesar":
+        key = random_caesar_shift(rng, symbols)
+        ciphertext = caesar_cipher(plaintext, key, True, symbols)
+    elif cipher == "vigenere":
+        key = random_keyword(rng, symbols)
+        ciphertext = vigenere_cipher(plaintext, key, True, symbols)
+    else:
+        key = random_rsa_key(rng, symbols)
+        M_ord = Utils.ord_array(plaintext, symbols, start_index=KEY_START_INDEX)
+        ciphertext = " ".join(map(str, encrypt(M_ord, key["e"], key["n"])))
+
+    truth = {"index": index, "cipher": cipher, "length": length, "key": key}
+    return plaintext, ciphertext, truth
+
+
+def generate_records(
+    size: int,
+    cipher: Optional[str] = None,
+    symbols: Symbol_Set = None,
+    dist: Optional[dict[str, float]] = None,
+    seed: int = DEFAULT_SEED,
+    record_length: int = RECORD_LENGTH,
+) -> Iterator[tuple[str, str, dict]]:
+    """
+    Lazily generate records totalling size plaintext characters.
+
+    Records are record_length characters long; the last one is shorter if
+    size is not a multiple of record_length.
+
+    Args:
+        size: Total plaintext characters
+        cipher: One of CIPHERS, or None to mix them
+        symbols: Symbol_Set of the plaintext (defaults to printable ASCII)
+        dist: Character frequencies of the plaintext (defaults to uniform)
+        seed: Corpus seed; the same arguments always give the same records
+        record_length: Plaintext characters per record
+
+    Yields:
+        tuple[str, str, dict]: (plaintext, ciphertext, ground truth)
+
+    Raises:
+        ValueError: If size is negative or record_length is not positive
+    """
+    if size < 0:
+        raise ValueError("size must not be negative.")
+    if record_length <= 0:
+        raise ValueError("record_length must be a positive integer.")
+    symbols = Utils.default_set(symbols)
+    cum_weights = _cumulative_weights(dist, symbols)
+    for index, start in enumerate(range(0, size, record_length)):
+        length = min(record_length, size - start)
+        yield generate_record(seed, index, length, cipher, symbols, dist, cum_weights)
+
+
+def write_corpus(
+    directory: str,
+    size: int,
+    cipher: Optional[str] = None,
+    symbols: Symbol_Set = None,
+    dist: Optional[dict[str, float]] = None,
+    seed: int = DEFAULT_SEED,
+    record_length: int = RECORD_LENGTH,
+) -> int:
+    """
+    Write a corpus to directory, one record per line in each of three files.
+
+    PLAINTEXTS and CIPHERTEXTS hold the texts, and TRUTH holds one JSON object
+    of ground truth per line. Records are written as they are generated, so
+    memory use depends on record_length and not on size.
+
+    Args:
+        directory: Output directory (created if missing; existing corpus files are overwritten)
+        size: Total plaintext characters, e.g. 1 << 30 for about a gigabyte
+        cipher: One of CIPHERS, or None to mix them
+        symbols: Symbol_Set of the plaintext (defaults to printable ASCII). Must not contain newlines.
+        dist: Character frequencies of the plaintext (defaults to uniform)
+        seed: Corpus seed
+        record_length: Plaintext characters per record
+
+    Returns:
+        int: Number of records written
+
+    Raises:
+        ValueError: If symbols contains a newline, or the arguments are invalid (see generate_records())
+
+    Example:
+        >>> write_corpus("corpus", 1 << 20, "vigenere", UPPER_SPACE, english_dist)
+        256
+    """
+    symbols = Utils.default_set(symbols)
+    if "\n" in symbols or "\r" in symbols:
+        raise ValueError("Corpus files are line-based; symbols must not contain newlines.")
+
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    with open(os.path.join(directory, PLAINTEXTS), "w", encoding="utf-8", buffering=WRITE_BUFFER) as p_file, \
+         open(os.path.join(directory, CIPHERTEXTS), "w", encoding="utf-8", buffering=WRITE_BUFFER) as c_file, \
+         open(os.path.join(directory, TRUTH), "w", encoding="utf-8", buffering=WRITE_BUFFER) as t_file:
+        for plaintext, ciphertext, truth in generate_records(size, cipher, symbols, dist, seed, record_length):
+            p_file.write(plaintext + "\n")
+            c_file.write(ciphertext + "\n")
+            t_file.write(json.dumps(truth) + "\n")
+            count += 1
+    return count
+
+
+def read_corpus(directory: str) -> Iterator[tuple[str, str, dict]]:
+    """
+    Stream the records of a corpus written by write_corpus().
+
+    Args:
+        directory: Corpus directory
+
+    Yields:
+        tuple[str, str, dict]: (plaintext, ciphertext, ground truth)
+    """
+    with open(os.path.join(directory, PLAINTEXTS), "r", encoding="utf-8") as p_file, \
+         open(os.path.join(directory, CIPHERTEXTS), "r", encoding="utf-8") as c_file, \
+         open(os.path.join(directory, TRUTH), "r", encoding="utf-8") as t_file:
+        for plaintext, ciphertext, truth in zip(p_file, c_file, t_file):
+            yield plaintext.rstrip("\n"), ciphertext.rstrip("\n"), json.loads(truth)
+
+
+def main() -> None:
+    """
+    Writes a small mixed corpus to a temporary directory and checks every record against its ground truth.
+    """
+    try:
+        sample = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG WHILE THE CAT SLEEPS IN THE SUN"
+        dist = Frequency_Table.from_text(sample, UPPER_SPACE).normalize().to_dict()
+
+        with tempfile.TemporaryDirectory() as directory:
+            count = write_corpus(directory, 1000, None, UPPER_SPACE, dist, record_length=200)
+            print(f"Wrote {count} records to {directory}")
+            for plaintext, ciphertext, truth in read_corpus(directory):
+                key = truth["key"]
+                if truth["cipher"] == "caesar":
+                    decrypted = caesar_cipher(ciphertext, key, False, UPPER_SPACE)
+                elif truth["cipher"] == "vigenere":
+                    decrypted = vigenere_cipher(ciphertext, key, False, UPPER_SPACE)
+                else:
+                    M_ord = encrypt([int(c) for c in ciphertext.split()], key["d"], key["n"])
+                    decrypted = Utils.chr_array(M_ord, UPPER_SPACE, start_index=KEY_START_INDEX)
+                print(f"Record {truth['index']}: {truth['cipher']} key={key}, "
+                      f"{ciphertext[:30]}... round trip {'ok' if decrypted == plaintext else 'FAILED'}")
+
+    except ValueError as err:
+        print(f"[ERROR] {err}")
+
+
+if __name__ == "__main__":
+    main()